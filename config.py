@@ -4,8 +4,10 @@ Configuration Management Module
 Centralized settings and configuration for the subtitle sync system
 """
 
+import atexit
 import json
 import os
+import threading
 from typing import Dict, List, Any, Optional
 
 class Config:
@@ -100,6 +102,16 @@ class Config:
         }
         
         self.settings = self.load_config()
+
+        # Expanded once; expanduser hits getpwuid on every call otherwise
+        self._archive_dir = os.path.expanduser(
+            self.settings.get("archive_directory", "~/subtitle_archive"))
+
+        # Debounced save state - rapid set() bursts coalesce into one write
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        atexit.register(self.flush)
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -107,43 +119,82 @@ class Config:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
                     saved_settings = json.load(f)
-                    # Merge with defaults
-                    settings = self.defaults.copy()
-                    settings.update(saved_settings)
-                    return settings
+                    # Merge with defaults (single C-level dict merge)
+                    return self.defaults | saved_settings
         except Exception as e:
             print(f"⚠️ Config load error: {e}")
         
         return self.defaults.copy()
     
-    def save_config(self) -> bool:
-        """Save configuration to file"""
+    def save_config(self, compact: bool = True) -> bool:
+        """Save configuration to file (compact JSON for programmatic saves)"""
         try:
             with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2, sort_keys=True)
+                if compact:
+                    json.dump(self.settings, f, separators=(',', ':'))
+                else:
+                    json.dump(self.settings, f, indent=2, sort_keys=True)
             print(f"💾 Configuration saved to {self.config_file}")
             return True
         except Exception as e:
             print(f"❌ Config save error: {e}")
             return False
+
+    def export_config(self) -> bool:
+        """Write a human-readable (pretty-printed, sorted) config file"""
+        return self.save_config(compact=False)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
         return self.settings.get(key, default)
-    
+
+    def get_many(self, keys, defaults: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Get several configuration values in one pass over the store"""
+        settings = self.settings
+        if defaults is None:
+            return {key: settings.get(key) for key in keys}
+        return {key: settings.get(key, defaults.get(key)) for key in keys}
+
     def set(self, key: str, value: Any) -> bool:
-        """Set configuration value and save"""
+        """Set configuration value and schedule a save"""
         self.settings[key] = value
-        return self.save_config()
-    
+        if key == "archive_directory":
+            self._archive_dir = os.path.expanduser(value)
+        return self._schedule_save()
+
     def update(self, updates: Dict[str, Any]) -> bool:
         """Update multiple configuration values"""
         self.settings.update(updates)
+        if "archive_directory" in updates:
+            self._archive_dir = os.path.expanduser(updates["archive_directory"])
+        return self._schedule_save()
+
+    def _schedule_save(self) -> bool:
+        """Coalesce rapid set() calls into a single deferred file write"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.2, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """Write any pending changes to disk immediately"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
         return self.save_config()
     
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
-        self.settings = self.defaults.copy()
+        self.settings = dict(self.defaults)
+        self._archive_dir = os.path.expanduser(self.settings["archive_directory"])
         return self.save_config()
     
     def get_bazarr_config(self) -> Dict[str, str]:
@@ -177,7 +228,7 @@ class Config:
         return {
             "base_paths": self.get("base_paths"),
             "path_mappings": self.get("path_mappings"),
-            "archive_directory": os.path.expanduser(self.get("archive_directory"))
+            "archive_directory": self._archive_dir
         }
     
     def show_current_config(self):
@@ -16,6 +16,13 @@ except ImportError:
     print("⚠️ Could not import database_manager.py - using fallback implementation")
     CoreDatabaseManager = None
 
+# Fetch-mode dispatch for execute_query - avoids per-call string comparisons
+_FETCH = {
+    None: lambda cursor: None,
+    "one": lambda cursor: cursor.fetchone(),
+    "all": lambda cursor: cursor.fetchall(),
+}
+
 class Database:
     """Enhanced database management using your existing DatabaseManager"""
     
@@ -78,15 +85,12 @@ class Database:
         """Execute database query with proper connection handling"""
         try:
             conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute(query, params)
-            
-            result = None
-            if fetch == "one":
-                result = cursor.fetchone()
-            elif fetch == "all":
-                result = cursor.fetchall()
-            
+
+            result = _FETCH[fetch](cursor)
+
             conn.commit()
             conn.close()
             return result
@@ -198,13 +202,12 @@ class Database:
             """.format(days), fetch="one")
             
             if result:
-                total, successful, avg_time, min_time, max_time = result
-                stats['total'] = total or 0
-                stats['successful'] = successful or 0
-                stats['success_rate'] = (successful / total * 100) if total > 0 else 0
-                stats['avg_time'] = avg_time or 0
-                stats['min_time'] = min_time or 0
-                stats['max_time'] = max_time or 0
+                # Rows come back keyed by the column aliases above
+                stats.update({key: result[key] or 0
+                              for key in ('total', 'successful', 'avg_time',
+                                          'min_time', 'max_time')})
+                stats['success_rate'] = (stats['successful'] / stats['total'] * 100) \
+                    if stats['total'] > 0 else 0
         except Exception as e:
             # If sync_history table doesn't exist, return default stats
             pass
@@ -236,9 +239,11 @@ class Database:
         }
         
         try:
-            # Test write access
-            self.execute_query("SELECT 1")
-            
+            # Test write access at stat(2) cost instead of opening sqlite
+            health["writable"] = os.access(self.db_path, os.W_OK)
+            if not health["writable"]:
+                return health
+
             # Count total syncs - use core database if available
             if self.use_core and hasattr(self.core_db, 'get_sync_count'):
                 health["total_syncs"] = self.core_db.get_sync_count()
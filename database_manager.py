@@ -1,254 +1,335 @@
-#!/usr/bin/env python3
-"""
-Database management for the Enhanced Subtitle Sync System
-"""
-
-import sqlite3
-import os
-
-class DatabaseManager:
-    def __init__(self):
-        """Initialize database connections"""
-        self.init_databases()
-    
-    def init_databases(self):
-        """Initialize all required databases"""
-        try:
-            # Main tracking database - use local path
-            db_path = "bazarr_sync_tracking.db"
-            self.conn = sqlite3.connect(db_path)
-            print(f"📊 Enhanced database initialized: {db_path}")
-            
-            # Sync history database - use local path instead of Mac-specific path
-            sync_db_path = "subtitle_sync_history.db"
-            self.sync_conn = sqlite3.connect(sync_db_path)
-            print(f"   📊 Sync tracking database initialized: {sync_db_path}")
-            
-            # Create tables
-            self.create_tables()
-            print("📊 Database tables created successfully")
-            
-        except Exception as e:
-            print(f"❌ Database initialization failed: {e}")
-            # Set connections to None so we know they failed
-            self.conn = None
-            self.sync_conn = None
-    
-    def close_connections(self):
-        """Close all database connections"""
-        try:
-            if self.conn:
-                self.conn.close()
-                self.conn = None
-            if self.sync_conn:
-                self.sync_conn.close()
-                self.sync_conn = None
-            print("📊 Database connections closed")
-        except Exception as e:
-            print(f"⚠️ Error closing connections: {e}")
-    
-    def create_tables(self):
-        """Create necessary database tables with correct schema"""
-        try:
-            cursor = self.conn.cursor()
-            
-            # Drop existing tables if they have wrong schema
-            cursor.execute("DROP TABLE IF EXISTS credentials")
-            cursor.execute("DROP TABLE IF EXISTS sync_history")
-            
-            # Create credentials table with correct schema
-            cursor.execute("""
-                CREATE TABLE credentials (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    service TEXT NOT NULL UNIQUE,
-                    bazarr_url TEXT,
-                    bazarr_api_key TEXT,
-                    last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create sync history table with language column
-            cursor.execute("""
-                CREATE TABLE sync_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    video_file TEXT NOT NULL,
-                    subtitle_file TEXT NOT NULL,
-                    output_path TEXT,
-                    sync_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    sync_method TEXT DEFAULT 'hybrid',
-                    status TEXT DEFAULT 'completed',
-                    processing_time REAL,
-                    language TEXT DEFAULT 'nl'
-                )
-            """)
-            
-            self.conn.commit()
-            print("📊 Database tables created successfully")
-            
-        except Exception as e:
-            print(f"❌ Error creating tables: {e}")
-        
-    def save_bazarr_credentials(self, url, api_key):
-        """Save Bazarr credentials to database"""
-        try:
-            # Use a fresh connection for this operation
-            conn = sqlite3.connect("bazarr_sync_tracking.db")
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO credentials (service, bazarr_url, bazarr_api_key, last_updated)
-                VALUES ('bazarr', ?, ?, CURRENT_TIMESTAMP)
-            """, (url, api_key))
-            conn.commit()
-            conn.close()  # Always close the connection
-            print("💾 Bazarr credentials saved successfully")
-            return True
-        except Exception as e:
-            print(f"❌ Could not save credentials: {e}")
-            return False
-
-    def load_bazarr_credentials(self):
-        """Load Bazarr credentials from database"""
-        try:
-            # Use a fresh connection for this operation
-            conn = sqlite3.connect("bazarr_sync_tracking.db")
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT bazarr_url, bazarr_api_key FROM credentials 
-                WHERE service = 'bazarr' 
-                ORDER BY last_updated DESC 
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            conn.close()  # Always close the connection
-            
-            if result:
-                return result[0], result[1]  # url, api_key
-            else:
-                return None, None
-                
-        except Exception as e:
-            print(f"❌ Error loading credentials: {e}")
-            return None, None
-
-    def save_plex_credentials(self, url, token):
-        """Save Plex credentials to database"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO credentials (service, bazarr_url, bazarr_api_key, last_updated)
-                VALUES ('plex', ?, ?, CURRENT_TIMESTAMP)
-            """, (url, token))
-            self.conn.commit()
-            print("💾 Plex credentials saved successfully")
-            return True
-        except Exception as e:
-            print(f"❌ Could not save Plex credentials: {e}")
-            return False
-
-    def load_plex_credentials(self):
-        """Load Plex credentials from database"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT bazarr_url, bazarr_api_key FROM credentials 
-                WHERE service = 'plex' 
-                ORDER BY last_updated DESC 
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            
-            if result:
-                return result[0], result[1]  # url, token
-            else:
-                return None, None
-                
-        except Exception as e:
-            print(f"❌ Error loading Plex credentials: {e}")
-            return None, None
-
-    def archive_old_subtitle(self, subtitle_file):
-        """Archive old subtitle before overwriting"""
-        try:
-            import shutil
-            from datetime import datetime
-            
-            # Create archive directory
-            archive_dir = os.path.join(os.path.dirname(subtitle_file), "subtitle_archive")
-            os.makedirs(archive_dir, exist_ok=True)
-            
-            # Create archived filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = os.path.basename(subtitle_file)
-            name, ext = os.path.splitext(filename)
-            archived_name = f"{name}_backup_{timestamp}{ext}"
-            
-            # Archive the file
-            archive_path = os.path.join(archive_dir, archived_name)
-            shutil.copy2(subtitle_file, archive_path)
-            
-            print(f"      📦 Archived original: {archived_name}")
-            return archive_path
-            
-        except Exception as e:
-            print(f"      ⚠️  Could not archive subtitle: {e}")
-            return None
-
-    def is_already_synced(self, video_file, subtitle_file):
-        """Check if file combination was already synced"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM sync_history 
-                WHERE video_file = ? AND subtitle_file = ? AND status = 'completed'
-                AND sync_timestamp > datetime('now', '-7 days')
-            """, (video_file, subtitle_file))
-            
-            result = cursor.fetchone()
-            return result[0] > 0 if result else False
-            
-        except Exception as e:
-            print(f"      ⚠️  Could not check sync status: {e}")
-            return False
-
-    def record_sync_result(self, video_file, subtitle_file, language, processing_time, output_path):
-        """Record sync result in database"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO sync_history 
-                (video_file, subtitle_file, language, processing_time, output_path, status)
-                VALUES (?, ?, ?, ?, ?, 'completed')
-            """, (video_file, subtitle_file, language, processing_time, output_path))
-            self.conn.commit()
-        except Exception as e:
-            print(f"      ⚠️  Could not record sync result: {e}")
-
-    def get_sync_statistics(self, days=7):
-        """Get sync statistics from database"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_syncs,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as successful_syncs,
-                    AVG(processing_time) as avg_time,
-                    MIN(sync_timestamp) as first_sync,
-                    MAX(sync_timestamp) as last_sync
-                FROM sync_history
-                WHERE sync_timestamp >= datetime('now', '-{} days')
-            """.format(days))
-            
-            result = cursor.fetchone()
-            if result:
-                total, success, avg_time, first, last = result
-                return {
-                    'total_syncs': total,
-                    'successful_syncs': success,
-                    'success_rate': (success / total * 100) if total > 0 else 0,
-                    'avg_processing_time': avg_time or 0,
-                    'first_sync': first,
-                    'last_sync': last
-                }
-        except Exception as e:
-            print(f"❌ Error getting statistics: {e}")
+#!/usr/bin/env python3
+"""
+Database management for the Enhanced Subtitle Sync System
+"""
+
+import atexit
+import sqlite3
+import threading
+import os
+
+# Bump when the table layout changes; triggers a one-time rebuild below
+SCHEMA_VERSION = 1
+
+# Archive directories already created this run - lets archive_old_subtitle
+# skip the makedirs syscall after the first file in a directory
+_known_archive_dirs = set()
+
+def _fast_copy(src, dst):
+    """Copy src to dst inside the kernel (no userspace bounce buffers)"""
+    import shutil
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            os.sendfile(fdst.fileno(), fsrc.fileno(), 0,
+                        os.fstat(fsrc.fileno()).st_size)
+        except (AttributeError, OSError):
+            # sendfile unavailable (non-Linux) or unsupported target
+            shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+    shutil.copystat(src, dst)
+
+# SQL hoisted to module constants so the same interned string hits
+# sqlite3's per-connection statement cache on every call
+_SAVE_BAZARR_SQL = """
+    INSERT OR REPLACE INTO credentials (service, bazarr_url, bazarr_api_key, last_updated)
+    VALUES ('bazarr', ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_LOAD_BAZARR_SQL = """
+    SELECT bazarr_url, bazarr_api_key FROM credentials
+    WHERE service = 'bazarr'
+    ORDER BY last_updated DESC
+    LIMIT 1
+"""
+
+_SAVE_PLEX_SQL = """
+    INSERT OR REPLACE INTO credentials (service, bazarr_url, bazarr_api_key, last_updated)
+    VALUES ('plex', ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_LOAD_PLEX_SQL = """
+    SELECT bazarr_url, bazarr_api_key FROM credentials
+    WHERE service = 'plex'
+    ORDER BY last_updated DESC
+    LIMIT 1
+"""
+
+_CHECK_SYNCED_SQL = """
+    SELECT 1 FROM sync_history
+    WHERE video_file = ? AND subtitle_file = ? AND status = 'completed'
+    AND sync_timestamp > datetime('now', '-7 days')
+    LIMIT 1
+"""
+
+_INSERT_SYNC_SQL = """
+    INSERT INTO sync_history
+    (video_file, subtitle_file, language, processing_time, output_path, status)
+    VALUES (?, ?, ?, ?, ?, 'completed')
+"""
+
+_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_syncs,
+        COUNT(CASE WHEN status = 'completed' THEN 1 END) as successful_syncs,
+        AVG(processing_time) as avg_time,
+        MIN(sync_timestamp) as first_sync,
+        MAX(sync_timestamp) as last_sync
+    FROM sync_history
+    WHERE sync_timestamp >= datetime('now', ? || ' days')
+"""
+
+class DatabaseManager:
+    def __init__(self):
+        """Initialize database connections"""
+        self._write_lock = threading.Lock()
+        # Buffered sync-history rows, flushed in one transaction per batch
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._batch_size = 50
+        self.init_databases()
+        # Short runs never reach _batch_size - drain the buffer at exit
+        atexit.register(self.flush_pending)
+
+    @staticmethod
+    def _tune(conn):
+        """Apply production PRAGMAs: WAL for concurrent readers, one less
+        fsync per commit, bigger cache and mmap'd page reads"""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=134217728")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def init_databases(self):
+        """Initialize all required databases"""
+        try:
+            # Main tracking database - use local path
+            db_path = "bazarr_sync_tracking.db"
+            self.conn = self._tune(sqlite3.connect(db_path))
+            print(f"📊 Enhanced database initialized: {db_path}")
+
+            # All tracking queries run through self.conn; the former second
+            # connection to subtitle_sync_history.db was never queried and
+            # only cost file handles and WAL syncs
+            
+            # Create tables
+            self.create_tables()
+            print("📊 Database tables created successfully")
+            
+        except Exception as e:
+            print(f"❌ Database initialization failed: {e}")
+            # Set connection to None so we know it failed
+            self.conn = None
+    
+    def close_connections(self):
+        """Close all database connections"""
+        try:
+            self.flush_pending()
+            if self.conn:
+                # Refresh planner stats and fold the WAL back into the main
+                # file so the next start doesn't replay it
+                self.conn.execute("PRAGMA optimize")
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.conn.close()
+                self.conn = None
+            print("📊 Database connections closed")
+        except Exception as e:
+            print(f"⚠️ Error closing connections: {e}")
+    
+    def create_tables(self):
+        """Create necessary database tables with correct schema"""
+        try:
+            # Rebuild only when the stored schema version is stale - earlier
+            # releases dropped and recreated both tables on every startup,
+            # which wiped all credentials and history
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS credentials")
+                self.conn.execute("DROP TABLE IF EXISTS sync_history")
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            # Create credentials table with correct schema
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS credentials (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    service TEXT NOT NULL UNIQUE,
+                    bazarr_url TEXT,
+                    bazarr_api_key TEXT,
+                    last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create sync history table with language column
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    video_file TEXT NOT NULL,
+                    subtitle_file TEXT NOT NULL,
+                    output_path TEXT,
+                    sync_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    sync_method TEXT DEFAULT 'hybrid',
+                    status TEXT DEFAULT 'completed',
+                    processing_time REAL,
+                    language TEXT DEFAULT 'nl'
+                )
+            """)
+
+            # Composite index so is_already_synced is a B-tree probe, not a scan
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sync_lookup
+                ON sync_history(video_file, subtitle_file, status, sync_timestamp DESC)
+            """)
+
+            # Covering index so get_sync_statistics aggregates from index
+            # leaves without touching the table
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sync_ts_status
+                ON sync_history(sync_timestamp, status, processing_time)
+            """)
+
+            self.conn.commit()
+            print("📊 Database tables created successfully")
+            
+        except Exception as e:
+            print(f"❌ Error creating tables: {e}")
+        
+    def save_bazarr_credentials(self, url, api_key):
+        """Save Bazarr credentials to database"""
+        try:
+            # Reuse the persistent connection instead of opening a new one
+            # Connection context manager commits on success, rolls back on error
+            with self._write_lock, self.conn:
+                self.conn.execute(_SAVE_BAZARR_SQL, (url, api_key))
+            print("💾 Bazarr credentials saved successfully")
+            return True
+        except Exception as e:
+            print(f"❌ Could not save credentials: {e}")
+            return False
+
+    def load_bazarr_credentials(self):
+        """Load Bazarr credentials from database"""
+        try:
+            # Reuse the persistent connection instead of opening a new one
+            result = self.conn.execute(_LOAD_BAZARR_SQL).fetchone()
+
+            if result:
+                return result[0], result[1]  # url, api_key
+            else:
+                return None, None
+                
+        except Exception as e:
+            print(f"❌ Error loading credentials: {e}")
+            return None, None
+
+    def save_plex_credentials(self, url, token):
+        """Save Plex credentials to database"""
+        try:
+            with self._write_lock, self.conn:
+                self.conn.execute(_SAVE_PLEX_SQL, (url, token))
+            print("💾 Plex credentials saved successfully")
+            return True
+        except Exception as e:
+            print(f"❌ Could not save Plex credentials: {e}")
+            return False
+
+    def load_plex_credentials(self):
+        """Load Plex credentials from database"""
+        try:
+            result = self.conn.execute(_LOAD_PLEX_SQL).fetchone()
+            
+            if result:
+                return result[0], result[1]  # url, token
+            else:
+                return None, None
+                
+        except Exception as e:
+            print(f"❌ Error loading Plex credentials: {e}")
+            return None, None
+
+    def archive_old_subtitle(self, subtitle_file):
+        """Archive old subtitle before overwriting"""
+        try:
+            import time
+
+            # Create archive directory (skipped once known to exist)
+            archive_dir = os.path.join(os.path.dirname(subtitle_file), "subtitle_archive")
+            if archive_dir not in _known_archive_dirs:
+                os.makedirs(archive_dir, exist_ok=True)
+                _known_archive_dirs.add(archive_dir)
+
+            # Create archived filename with timestamp (C-level strftime,
+            # no datetime object per call)
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = os.path.basename(subtitle_file)
+            name, ext = os.path.splitext(filename)
+            archived_name = f"{name}_backup_{timestamp}{ext}"
+
+            # Archive the file - a real copy, not a hardlink: callers
+            # overwrite the subtitle in place afterwards, and a link
+            # would alias the archive to the rewritten content
+            archive_path = os.path.join(archive_dir, archived_name)
+            _fast_copy(subtitle_file, archive_path)
+
+            print(f"      📦 Archived original: {archived_name}")
+            return archive_path
+
+        except Exception as e:
+            print(f"      ⚠️  Could not archive subtitle: {e}")
+            return None
+
+    def is_already_synced(self, video_file, subtitle_file):
+        """Check if file combination was already synced"""
+        try:
+            # Make buffered rows from this run visible to the query
+            self.flush_pending()
+            return self.conn.execute(_CHECK_SYNCED_SQL,
+                                     (video_file, subtitle_file)).fetchone() is not None
+            
+        except Exception as e:
+            print(f"      ⚠️  Could not check sync status: {e}")
+            return False
+
+    def record_sync_result(self, video_file, subtitle_file, language, processing_time, output_path):
+        """Record sync result (buffered; flushed in batches of one transaction)"""
+        try:
+            with self._pending_lock:
+                self._pending.append((video_file, subtitle_file, language, processing_time, output_path))
+                should_flush = len(self._pending) >= self._batch_size
+            if should_flush:
+                self.flush_pending()
+            return True
+        except Exception as e:
+            print(f"      ⚠️  Could not record sync result: {e}")
+            return False
+
+    def flush_pending(self):
+        """Write buffered sync-history rows in a single transaction"""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        try:
+            with self._write_lock:
+                with self.conn:
+                    self.conn.executemany(_INSERT_SYNC_SQL, rows)
+        except Exception as e:
+            print(f"      ⚠️  Could not record sync results: {e}")
+
+    def get_sync_statistics(self, days=7):
+        """Get sync statistics from database"""
+        try:
+            result = self.conn.execute(_STATS_SQL, (f"-{int(days)}",)).fetchone()
+            if result:
+                total, success, avg_time, first, last = result
+                return {
+                    'total_syncs': total,
+                    'successful_syncs': success,
+                    'success_rate': (success / total * 100) if total > 0 else 0,
+                    'avg_processing_time': avg_time or 0,
+                    'first_sync': first,
+                    'last_sync': last
+                }
+        except Exception as e:
+            print(f"❌ Error getting statistics: {e}")
         return None
\ No newline at end of file
@@ -5,6 +5,7 @@ Debug the actual data structure returned by Bazarr's episodes/wanted API
 
 import requests
 import json
+import pprint
 import sys
 import os
 
@@ -14,6 +15,18 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from credential_manager import CredentialManager
 from database_manager import DatabaseManager
 
+# Field aliases Bazarr has used across versions, checked in one pass
+# instead of chained episode.get(...) or episode.get(...) expressions
+SERIES_KEYS = ('seriesTitle', 'series_title', 'series', 'title', 'seriesName')
+EPISODE_KEYS = ('episodeTitle', 'episode_title', 'episodeName', 'name')
+SEASON_KEYS = ('season', 'seasonNumber')
+EPISODE_NUM_KEYS = ('episode', 'episodeNumber')
+PATH_KEYS = ('path', 'episodePath')
+
+def pick(d, keys, default):
+    """Return the first present key's value from d, else default"""
+    return next((d[k] for k in keys if k in d), default)
+
 def debug_wanted_episodes_data():
     """Debug the actual structure of wanted episodes data"""
     try:
@@ -55,42 +68,30 @@ def debug_wanted_episodes_data():
                     print(f"   Keys available: {list(first_episode.keys())}")
                     
                     print(f"\n📝 Sample episode data:")
-                    for key, value in first_episode.items():
-                        # Truncate long values
-                        if isinstance(value, str) and len(value) > 100:
-                            value = value[:100] + "..."
-                        print(f"   {key}: {value}")
+                    # Truncate long values in one dict comprehension and let
+                    # pprint's C-accelerated printer do the formatting
+                    pprint.pprint({key: (value[:100] + "..."
+                                         if isinstance(value, str) and len(value) > 100
+                                         else value)
+                                   for key, value in first_episode.items()},
+                                  indent=3, sort_dicts=False)
                     
                     print(f"\n📺 Sample episodes formatted:")
                     for i, episode in enumerate(episodes[:3]):
                         print(f"\n   Episode {i+1}:")
                         
-                        # Try different possible field names for series title
-                        series_title = (episode.get('seriesTitle') or 
-                                      episode.get('series_title') or 
-                                      episode.get('series') or 
-                                      episode.get('title') or 
-                                      episode.get('seriesName') or
-                                      'Unknown Series')
-                        
-                        # Try different possible field names for episode title
-                        episode_title = (episode.get('episodeTitle') or 
-                                       episode.get('episode_title') or 
-                                       episode.get('episodeName') or
-                                       episode.get('name') or
-                                       'Unknown Episode')
-                        
-                        # Try to get season/episode numbers
-                        season = episode.get('season', episode.get('seasonNumber', '?'))
-                        episode_num = episode.get('episode', episode.get('episodeNumber', '?'))
-                        
+                        series_title = pick(episode, SERIES_KEYS, 'Unknown Series')
+                        episode_title = pick(episode, EPISODE_KEYS, 'Unknown Episode')
+                        season = pick(episode, SEASON_KEYS, '?')
+                        episode_num = pick(episode, EPISODE_NUM_KEYS, '?')
+
                         print(f"     Series: {series_title}")
                         print(f"     Episode: {episode_title}")
                         print(f"     Season: {season}")
                         print(f"     Episode #: {episode_num}")
-                        
+
                         # Check if there's a path
-                        path = episode.get('path', episode.get('episodePath', 'No path'))
+                        path = pick(episode, PATH_KEYS, 'No path')
                         print(f"     Path: {path}")
             
             else:
@@ -10,33 +10,40 @@ Run this if you get permission denied errors when using the archive functionalit
 import os
 import stat
 import getpass
+import functools
+
+# User identity never changes within a process - cache the pwd-db lookup
+# and the getuid syscall for callers that invoke this in a loop
+_get_username = functools.lru_cache(maxsize=1)(getpass.getuser)
+_get_uid = functools.lru_cache(maxsize=1)(os.getuid)
 
 def fix_archive_permissions():
     """Fix archive directory permissions"""
-    username = getpass.getuser()
+    username = _get_username()
     archive_dir = os.path.expanduser("~/subtitle_archive")
-    
+
     print(f"🔧 Fixing permissions for {archive_dir}")
     print(f"👤 Current user: {username}")
-    
-    if not os.path.exists(archive_dir):
+
+    try:
+        # One stat call answers existence, ownership and writability
+        stat_info = os.stat(archive_dir)
+    except FileNotFoundError:
         print(f"📁 Archive directory doesn't exist yet - will be created on first run")
         return
-    
+
     try:
-        # Check current ownership
-        stat_info = os.stat(archive_dir)
         current_uid = stat_info.st_uid
-        current_user_uid = os.getuid()
-        
+        current_user_uid = _get_uid()
+
         if current_uid != current_user_uid:
             print(f"❌ Archive directory owned by UID {current_uid}, but you are UID {current_user_uid}")
             print(f"💡 Run this command to fix:")
             print(f"   sudo chown -R {username} {archive_dir}")
             return False
-        
-        # Check if writable
-        if os.access(archive_dir, os.W_OK):
+
+        # Check if writable via the mode bits from the same stat call
+        if stat_info.st_mode & stat.S_IWUSR:
             print(f"✅ Archive directory permissions are correct!")
             return True
         else:
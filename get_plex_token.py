@@ -3,64 +3,69 @@
 Get Plex Authentication Token
 """
 
+import time
 import requests
-import getpass
 
 def get_plex_token():
-    """Get Plex token using username/password"""
+    """Get Plex token via the plex.tv PIN flow (no password needed)"""
     print("🔑 PLEX TOKEN RETRIEVAL")
     print("="*50)
     print("This will get your Plex authentication token")
-    print("Your credentials are only used to get the token, not stored")
+    print("You'll approve the request in your browser - no password is typed here")
     print()
-    
-    username = input("Plex username/email: ").strip()
-    if not username:
-        print("❌ Username required")
-        return None
-    
-    password = getpass.getpass("Plex password: ")
-    if not password:
-        print("❌ Password required")
-        return None
-    
+
     headers = {
         'X-Plex-Client-Identifier': 'SubSync-Manager',
         'X-Plex-Product': 'SubSync Manager',
-        'X-Plex-Version': '1.0'
+        'X-Plex-Version': '1.0',
+        'Accept': 'application/json'
     }
-    
+
+    # One keep-alive session for the pin request + polling
+    session = requests.Session()
+    session.headers.update(headers)
+
     try:
-        print("🔄 Authenticating with Plex...")
-        
-        response = requests.post(
-            'https://plex.tv/users/sign_in.json',
-            headers=headers,
-            data={
-                'user[login]': username,
-                'user[password]': password
-            },
-            timeout=30
-        )
-        
-        if response.status_code == 201:
-            data = response.json()
-            token = data['user']['authToken']
-            print(f"\n✅ Success! Your Plex token:")
-            print(f"🔑 {token}")
-            print(f"\n💡 Copy this token to use in the subtitle sync manager")
-            return token
-        else:
-            print(f"❌ Authentication failed: {response.status_code}")
-            if response.status_code == 401:
-                print("💡 Check your username/password")
-            elif response.status_code == 422:
-                print("💡 Invalid username/password format")
+        print("🔄 Requesting login PIN from Plex...")
+
+        response = session.post('https://plex.tv/api/v2/pins?strong=true', timeout=30)
+        if response.status_code not in (200, 201):
+            print(f"❌ Could not get login PIN: {response.status_code}")
             return None
-            
+
+        pin = response.json()
+        pin_id = pin['id']
+        code = pin['code']
+
+        auth_url = (
+            "https://app.plex.tv/auth#?"
+            f"clientID=SubSync-Manager&code={code}"
+            "&context%5Bdevice%5D%5Bproduct%5D=SubSync%20Manager"
+        )
+        print(f"\n🌐 Open this URL in your browser and sign in:")
+        print(f"   {auth_url}")
+        print("\n⏳ Waiting for you to approve the request...")
+
+        # Poll until the pin is claimed (or expires after ~30 minutes;
+        # we give up well before that)
+        for _ in range(150):
+            time.sleep(2)
+            poll = session.get(f'https://plex.tv/api/v2/pins/{pin_id}', timeout=30)
+            if poll.status_code != 200:
+                continue
+            token = poll.json().get('authToken')
+            if token:
+                print(f"\n✅ Success! Your Plex token:")
+                print(f"🔑 {token}")
+                print(f"\n💡 Copy this token to use in the subtitle sync manager")
+                return token
+
+        print("❌ Timed out waiting for approval - run this script again")
+        return None
+
     except Exception as e:
         print(f"❌ Error getting token: {e}")
         return None
 
 if __name__ == "__main__":
-    get_plex_token()
\ No newline at end of file
+    get_plex_token()
@@ -6,8 +6,22 @@ Main Entry Point for Enhanced Subtitle Sync System
 
 import os
 import sys
-import signal
-from pathlib import Path
+
+# Heavier stdlib modules (e.g. signal) and all service modules are
+# imported inside the functions that need them, so lightweight commands
+# like 'help' don't pay the full import chain. Path handling sticks to
+# os.path - importing pathlib costs tens of ms of cold start for what
+# are just dirname/exists calls here.
+
+__all__ = ["SubtitleSyncCLI", "main", "quick_sync", "show_status"]
+
+def __getattr__(name):
+    """Resolve the CLI class lazily (PEP 562) so importers of main don't
+    drag in cli -> sync_engine -> ffsubsync until it's actually used"""
+    if name == "SubtitleSyncCLI":
+        from cli import SubtitleSyncCLI
+        return SubtitleSyncCLI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully"""
@@ -16,6 +30,8 @@ def signal_handler(signum, frame):
 
 def check_dependencies():
     """Check for required dependencies"""
+    import importlib.util
+
     required_modules = [
         ('requests', 'pip install requests'),
         ('sqlite3', 'Built-in Python module'),
@@ -31,19 +47,20 @@ def check_dependencies():
     missing_required = []
     missing_optional = []
     
+    # A sys.modules hit means the module is already loaded - answer from
+    # that dict before touching the import finders. find_spec itself only
+    # consults the finders and never executes module code
     for module, install_cmd in required_modules:
-        try:
-            __import__(module)
+        if module in sys.modules or importlib.util.find_spec(module) is not None:
             print(f"✅ {module}")
-        except ImportError:
+        else:
             print(f"❌ {module} - {install_cmd}")
             missing_required.append((module, install_cmd))
-    
+
     for module, install_cmd in optional_modules:
-        try:
-            __import__(module)
+        if module in sys.modules or importlib.util.find_spec(module) is not None:
             print(f"✅ {module}")
-        except ImportError:
+        else:
             print(f"⚠️  {module} (optional) - {install_cmd}")
             missing_optional.append((module, install_cmd))
     
@@ -62,11 +79,14 @@ def check_dependencies():
     print("✅ Dependency check complete!")
     return True
 
+# Computed once at import - every caller shares the same script directory
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def setup_environment():
     """Setup environment and working directory"""
-    # Ensure we're in the right directory
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    # Ensure we're in the right directory (skip the chdir when already there)
+    if os.getcwd() != _SCRIPT_DIR:
+        os.chdir(_SCRIPT_DIR)
     
     # Create necessary directories
     directories = [
@@ -76,14 +96,19 @@ def setup_environment():
         "temp"
     ]
     
+    # mkdir only what's missing - on the warm path the isdir check is a
+    # stat, so no mkdir syscalls are issued at all
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        if not os.path.isdir(directory):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
     
     print(f"📁 Working directory: {os.getcwd()}")
 
-def show_banner():
-    """Show application banner"""
-    banner = """
+# Banner built once at import; show_banner writes it in a single syscall
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    🚀 ENHANCED SUBTITLE SYNC SYSTEM 🚀                      ║
 ║                                                                              ║
@@ -99,11 +124,16 @@ def show_banner():
 ║  • 🎯 Multiple VAD method fallbacks for maximum compatibility               ║
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    \n"""
+
+def show_banner():
+    """Show application banner"""
+    sys.stdout.write(_BANNER)
 
 def main():
     """Main application entry point"""
+    import signal
+
     # Set up signal handling
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -135,7 +165,7 @@ def main():
             ]
             
             for file in required_files:
-                exists = "✅" if Path(file).exists() else "❌"
+                exists = "✅" if os.path.exists(file) else "❌"
                 print(f"   {exists} {file}")
             
             return 1
@@ -203,10 +233,12 @@ def show_status():
         print(f"  PathMapper: {'✅' if sync_engine.use_pathmapper else '⚠️  Fallback'}")
         print(f"  Archive Manager: {'✅' if sync_engine.archive_manager else '❌'}")
         
-        # Bazarr status
+        # Bazarr status - don't probe the network when credentials are
+        # missing, the connection test can only fail (after its timeout)
+        configured = bazarr.is_configured()
         print("🌐 Bazarr:")
-        print(f"  Configured: {'✅' if bazarr.is_configured() else '❌'}")
-        print(f"  Connected: {'✅' if bazarr.test_connection() else '❌'}")
+        print(f"  Configured: {'✅' if configured else '❌'}")
+        print(f"  Connected: {'✅' if configured and bazarr.test_connection() else '❌'}")
         
         # Database status
         health = database.health_check()
@@ -226,27 +258,36 @@ def show_status():
         print(f"❌ Status check error: {e}")
         return False
 
+def show_help():
+    """Print usage - needs nothing beyond sys"""
+    print("🚀 Enhanced Subtitle Sync System")
+    print("\nUsage:")
+    print("  python main.py          - Start interactive mode")
+    print("  python main.py quick    - Quick sync all media")
+    print("  python main.py status   - Show system status")
+    print("  python main.py help     - Show this help")
+    return True
+
+# Alias -> handler table; one dict lookup replaces the if/elif chain.
+# argparse subparsers would cost more at startup than this whole script.
+_COMMANDS = {
+    'help': show_help, 'h': show_help, '--help': show_help, '-h': show_help,
+    'quick': quick_sync, 'q': quick_sync,
+    'status': show_status, 's': show_status,
+}
+
 if __name__ == "__main__":
     # Check for command line arguments
     if len(sys.argv) > 1:
         command = sys.argv[1].lower()
-        
-        if command in ['quick', 'q']:
-            sys.exit(0 if quick_sync() else 1)
-        elif command in ['status', 's']:
-            sys.exit(0 if show_status() else 1)
-        elif command in ['help', 'h', '--help', '-h']:
-            print("🚀 Enhanced Subtitle Sync System")
-            print("\nUsage:")
-            print("  python main.py          - Start interactive mode")
-            print("  python main.py quick    - Quick sync all media")
-            print("  python main.py status   - Show system status")
-            print("  python main.py help     - Show this help")
-            sys.exit(0)
-        else:
+        handler = _COMMANDS.get(command)
+
+        if handler is None:
             print(f"❌ Unknown command: {command}")
             print("💡 Use 'python main.py help' for available commands")
             sys.exit(1)
-    
+
+        sys.exit(0 if handler() else 1)
+
     # Default: start interactive mode
     sys.exit(main())
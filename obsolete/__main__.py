@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Thin dispatcher for the obsolete debug/analysis scripts
+
+Usage: python obsolete <command>
+
+Only the chosen script is imported, so running one command doesn't pay
+the import cost (sqlite3, requests, service modules) of the other seven.
+Each script remains runnable directly for back-compat.
+"""
+
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Scripts expect both the repo root (service modules) and this directory
+# on the path
+sys.path.insert(0, os.path.dirname(_HERE))
+sys.path.insert(0, _HERE)
+
+# command -> (module, entry point); resolved lazily on dispatch
+_COMMANDS = {
+    'dup': ('analyze_dutch_duplicates', 'main'),
+    'quick': ('quick_subtitle_analysis', 'quick_analysis'),
+    'bazarr': ('test_bazarr', 'test_bazarr_api'),
+    'credentials': ('test_credentials', 'test_credential_system'),
+    'simple-debug': ('simple_debug', None),  # runs at import
+}
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ('help', '-h', '--help'):
+        print("🧰 Obsolete script dispatcher")
+        print("\nUsage: python obsolete <command>")
+        print("\nCommands:")
+        for name in _COMMANDS:
+            print(f"  {name}")
+        return 0
+
+    command = sys.argv[1]
+    target = _COMMANDS.get(command)
+    if target is None:
+        print(f"❌ Unknown command: {command}")
+        print("💡 Use 'python obsolete help' for available commands")
+        return 1
+
+    module_name, func_name = target
+    import importlib
+    module = importlib.import_module(module_name)
+    if func_name is not None:
+        getattr(module, func_name)()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
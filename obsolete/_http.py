@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the obsolete test scripts
+
+The requests import chain (urllib3, charset detection, ...) is paid once
+here; every test that needs plain HTTP pulls the pre-built session out
+of sys.modules instead of importing requests and configuring its own.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "subsync-tests"})
+
+_ADAPTER = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared Plex client for the obsolete test scripts
+
+One memoized PlexSubtitleManager on a pooled Session means every test in
+the same process reuses the TCP connection to the Plex server instead of
+paying a fresh handshake per call.
+"""
+
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import config
+from plex_client import PlexSubtitleManager
+
+@functools.lru_cache(maxsize=1)
+def plex_client():
+    """Return the process-wide Plex client (built on first use)"""
+    session = requests.Session()
+    # No retries and a tight (connect, read) timeout - when the server
+    # is down the tests should fail in about a second, not block on the
+    # default timeout per call
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10,
+                          max_retries=Retry(total=0, connect=0, read=0))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return PlexSubtitleManager(
+        plex_url=config.get('plex_url', 'http://192.168.90.3:32400'),
+        plex_token=config.get('plex_token', ''),
+        session=session,
+        timeout=(1.0, 3.0)
+    )
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Shared worker pool for the obsolete test scripts
+
+Tests that fan work out keep tearing down and respawning their own
+ThreadPoolExecutor; this module holds one process-wide pool so
+sequential test invocations reuse the same threads. Shut down via
+atexit so scripts don't have to manage its lifetime.
+"""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+atexit.register(EXECUTOR.shutdown)
@@ -2,30 +2,50 @@
 """Quick Dutch subtitle analysis"""
 
 import os
-import subprocess
+
+def count_suffixes(path, suffixes):
+    """Count files per suffix in one in-process scandir traversal.
+
+    Replaces forking `find` once per pattern - a single getdents pass
+    over the tree serves every suffix with no subprocess or pipe cost.
+    """
+    counts = dict.fromkeys(suffixes, 0)
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    name = entry.name
+                    for suffix in suffixes:
+                        if name.endswith(suffix):
+                            counts[suffix] += 1
+                            break
+    return counts
 
 def quick_analysis():
     print("🎬 QUICK DUTCH SUBTITLE ANALYSIS")
     print("="*50)
-    
-    # Count files in main directories
-    def count_files(path, pattern):
-        try:
-            result = subprocess.run(['find', path, '-name', pattern], capture_output=True, text=True, timeout=30)
-            return len([line for line in result.stdout.strip().split('\n') if line])
-        except:
-            return 0
-    
-    # Count current Dutch subtitle files
-    movies_count = count_files('/Volumes/Data/Movies', '*.nl.srt')
-    tv_count = count_files('/Volumes/Data/TVShows', '*.nl.srt')
-    
-    # Count synced files
-    movies_synced = count_files('/Volumes/Data/Movies', '*.nl.synced.srt')
-    tv_synced = count_files('/Volumes/Data/TVShows', '*.nl.synced.srt')
-    
-    # Count archived files  
-    archived_count = count_files('/Users/adminvv/subtitle_archive', '*.nl.srt')
+
+    suffixes = ('.nl.synced.srt', '.nl.srt')
+
+    # One pass per tree counts both current and synced files
+    movie_counts = count_suffixes('/Volumes/Data/Movies', suffixes)
+    tv_counts = count_suffixes('/Volumes/Data/TVShows', suffixes)
+
+    movies_count = movie_counts['.nl.srt']
+    tv_count = tv_counts['.nl.srt']
+    movies_synced = movie_counts['.nl.synced.srt']
+    tv_synced = tv_counts['.nl.synced.srt']
+
+    # Count archived files
+    archived_count = count_suffixes('/Users/adminvv/subtitle_archive', ('.nl.srt',))['.nl.srt']
     
     print(f"📊 CURRENT STATUS:")
     print(f"   🎬 Movies - Dutch subtitles: {movies_count}")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Run the independent obsolete test scripts concurrently
+
+Each entry point mostly waits on Bazarr/Plex/disk I/O, so overlapping
+them collapses serial wall time to roughly the slowest single test.
+Output lines interleave - run a script on its own when readability
+matters more than speed.
+"""
+
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_HERE))
+sys.path.insert(0, _HERE)
+
+from _runner import EXECUTOR
+
+# (module, entry point) pairs - all importable without side effects
+_TESTS = (
+    ('test_fixes', 'test_fixes'),
+    ('test_pagination', 'test_bazarr_pagination'),
+    ('test_path_mapping', 'test_path_mapping'),
+    ('test_plex_integration', 'test_plex_integration'),
+    ('test_plex_search', 'test_plex_search'),
+    ('test_slice', 'test_series_slicing'),
+)
+
+def main():
+    print("🧪 RUNNING ALL OBSOLETE TESTS IN PARALLEL")
+    print("=" * 50)
+
+    futures = []
+    for module_name, func_name in _TESTS:
+        module = importlib.import_module(module_name)
+        futures.append((module_name, EXECUTOR.submit(getattr(module, func_name))))
+
+    failed = 0
+    for name, future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            failed += 1
+            print(f"❌ {name} failed: {e}")
+
+    print(f"\n🏁 {len(futures) - failed}/{len(futures)} test scripts completed")
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
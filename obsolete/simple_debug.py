@@ -16,38 +16,41 @@ for file in os.listdir('.'):
     if file.endswith('.db'):
         print(f"   🗄️ {file}")
 
-# Check each database file for bazarr credentials
+# Check each database file for bazarr credentials - one in-memory
+# connection with each file ATTACHed, instead of a full connection
+# open/close per file
 db_files = [f for f in os.listdir('.') if f.endswith('.db')]
 
-for db_file in db_files:
+conn = sqlite3.connect(':memory:')
+
+for i, db_file in enumerate(db_files):
     print(f"\n🔍 Checking {db_file}:")
+    schema = f"db{i}"
     try:
-        conn = sqlite3.connect(db_file)
-        cursor = conn.cursor()
-        
-        # Check what tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        print(f"   Tables: {[table[0] for table in tables]}")
-        
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (db_file,))
+
+        # Check what tables exist (table names come straight from
+        # sqlite_master, so they're safe to quote into later queries)
+        tables = [row[0] for row in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type='table'")]
+        print(f"   Tables: {tables}")
+
         # Look for bazarr credentials
-        if any('bazarr' in table[0].lower() for table in tables):
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE '%bazarr%';")
-            bazarr_tables = cursor.fetchall()
-            for table in bazarr_tables:
-                table_name = table[0]
-                print(f"   🔍 Checking table {table_name}:")
-                cursor.execute(f"SELECT * FROM {table_name}")
-                rows = cursor.fetchall()
-                if rows:
-                    print(f"      Found {len(rows)} rows")
-                    for row in rows:
-                        print(f"      Row: {row}")
-                else:
-                    print("      No data found")
-        
-        conn.close()
+        for table_name in tables:
+            if 'bazarr' not in table_name.lower():
+                continue
+            print(f"   🔍 Checking table {table_name}:")
+            rows = conn.execute(f'SELECT * FROM {schema}."{table_name}"').fetchall()
+            if rows:
+                print(f"      Found {len(rows)} rows")
+                for row in rows:
+                    print(f"      Row: {row}")
+            else:
+                print("      No data found")
+
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
+conn.close()
+
 print("\n✅ Debug complete!")
@@ -11,10 +11,12 @@ def test_plex_integration():
     print("🧪 TESTING PLEX INTEGRATION")
     print("=" * 50)
     
-    # Check config
-    plex_url = config.get("plex_url")
-    plex_token = config.get("plex_token") 
-    plex_enabled = config.get("plex_integration", True)
+    # Check config - one batched lookup instead of three round trips
+    vals = config.get_many(("plex_url", "plex_token", "plex_integration"),
+                           defaults={"plex_integration": True})
+    plex_url = vals["plex_url"]
+    plex_token = vals["plex_token"]
+    plex_enabled = vals["plex_integration"]
     
     print(f"📡 Plex URL: {plex_url}")
     print(f"🔑 Plex Token: {'Configured' if plex_token else 'Not configured'}")
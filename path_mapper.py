@@ -1,1138 +1,1575 @@
-"""
-Path Mapper - Maps Bazarr server paths to local Mac paths and handles sync coordination with tracking
-"""
-
-import os
-import re
-import subprocess
-import shutil
-import time
-import hashlib
-import sqlite3
-from pathlib import Path
-
-# Import subtitle translator
-from subtitle_translator import SubtitleTranslator
-
-def get_logger(name):
-    """Simple logger fallback"""
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    return logging.getLogger(name)
-
-class PathMapper:
-    def __init__(self, bazarr_client, config=None):
-        self.bazarr_client = bazarr_client
-        self.logger = get_logger('PathMapper')
-        self.config = config
-        
-        # Initialize subtitle translator if enabled
-        auto_translation = True  # Default enabled
-        if config:
-            auto_translation = config.get('auto_translation', True)
-        
-        if auto_translation:
-            self.translator = SubtitleTranslator(config)
-        else:
-            self.translator = None
-        
-        # Path mapping rules
-        self.path_mappings = {
-            # Bazarr server paths -> Local Mac paths
-            "/PlexMedia/Movies": "/Volumes/Data/Movies",
-            "/PlexMedia/TVShows": "/Volumes/Data/TVShows",
-            "/PlexMedia/Cartoons": "/Volumes/Data/Cartoons",
-            "/PlexMedia/Documentaries": "/Volumes/Data/Documentaries", 
-            "/PlexMedia/Christmas": "/Volumes/Data/Christmas",
-            "/PlexMedia/Dive": "/Volumes/Data/Dive",
-        }
-        
-        # Alternative local search paths for movie content
-        self.local_search_paths = [
-            "/Volumes/Data/Movies",
-            "/Volumes/Data/TVShows",
-            "/Volumes/Data/Cartoons",
-            "/Volumes/Data/Documentaries",
-            "/Volumes/Data/Christmas",
-            "/Volumes/Data/Dive",
-            "/Volumes/Data",
-        ]
-        
-        # Initialize sync tracking database
-        self.init_sync_database()
-    
-    def init_sync_database(self):
-        """Initialize SQLite database for tracking sync history"""
-        try:
-            db_path = os.path.expanduser("~/subtitle_sync_history.db")
-            self.conn = sqlite3.connect(db_path)
-            
-            # Create sync history table
-            self.conn.execute("""
-                CREATE TABLE IF NOT EXISTS sync_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    video_path TEXT NOT NULL,
-                    subtitle_path TEXT NOT NULL,
-                    synced_subtitle_path TEXT NOT NULL,
-                    video_hash TEXT,
-                    subtitle_hash TEXT,
-                    sync_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    sync_offset REAL,
-                    processing_time REAL,
-                    sync_method TEXT,
-                    status TEXT,
-                    UNIQUE(video_path, subtitle_path)
-                )
-            """)
-            
-            self.conn.commit()
-            print(f"   📊 Sync tracking database initialized: {db_path}")
-            
-        except Exception as e:
-            print(f"   ⚠️ Could not initialize sync database: {e}")
-            self.conn = None
-    
-    def get_file_hash(self, file_path, sample_size=1024*1024):
-        """Get a quick hash of file (first 1MB) for change detection"""
-        try:
-            hasher = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                hasher.update(f.read(sample_size))
-            return hasher.hexdigest()
-        except:
-            return None
-    
-    def is_already_synced(self, video_path, subtitle_path):
-        """Check if subtitle is already synced and up to date"""
-        if not self.conn:
-            return False, None
-        
-        try:
-            # First check if .synced.srt file exists
-            synced_path = self.get_synced_subtitle_path(subtitle_path)
-            if os.path.exists(synced_path):
-                print(f"   ✅ Found existing synced subtitle: {os.path.basename(synced_path)}")
-                
-                # Check database for sync details
-                cursor = self.conn.execute("""
-                    SELECT sync_timestamp, sync_offset, processing_time, sync_method, video_hash, subtitle_hash
-                    FROM sync_history 
-                    WHERE video_path = ? AND subtitle_path = ?
-                    ORDER BY sync_timestamp DESC LIMIT 1
-                """, (video_path, subtitle_path))
-                
-                result = cursor.fetchone()
-                if result:
-                    timestamp, offset, proc_time, method, old_video_hash, old_sub_hash = result
-                    
-                    # Check if files have changed since last sync
-                    current_video_hash = self.get_file_hash(video_path)
-                    current_sub_hash = self.get_file_hash(subtitle_path)
-                    
-                    if (current_video_hash == old_video_hash and 
-                        current_sub_hash == old_sub_hash):
-                        print(f"   ✅ Subtitle already synced on {timestamp}")
-                        print(f"   📊 Previous sync: offset={offset:.3f}s, time={proc_time:.1f}s, method={method}")
-                        return True, synced_path
-                    else:
-                        print(f"   ⚠️ Files changed since last sync - will re-sync")
-                else:
-                    print(f"   ⚠️ Synced file exists but no database record - will verify")
-                
-                return True, synced_path  # Use existing synced file anyway
-            
-            return False, None
-            
-        except Exception as e:
-            print(f"   ⚠️ Error checking sync status: {e}")
-            return False, None
-    
-    def get_synced_subtitle_path(self, original_subtitle_path):
-        """Get the path for the synced subtitle file"""
-        base_path = os.path.splitext(original_subtitle_path)[0]
-        return f"{base_path}.synced.srt"
-    
-    def record_sync_result(self, video_path, subtitle_path, synced_path, success, offset=0.0, processing_time=0.0, method="ffsubsync"):
-        """Record sync result in database"""
-        if not self.conn:
-            return
-        
-        try:
-            video_hash = self.get_file_hash(video_path)
-            subtitle_hash = self.get_file_hash(subtitle_path)
-            
-            # Insert or replace sync record
-            self.conn.execute("""
-                INSERT OR REPLACE INTO sync_history 
-                (video_path, subtitle_path, synced_subtitle_path, video_hash, subtitle_hash,
-                 sync_offset, processing_time, sync_method, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                video_path, subtitle_path, synced_path, video_hash, subtitle_hash,
-                offset, processing_time, method, "success" if success else "failed"
-            ))
-            
-            self.conn.commit()
-            print(f"   📊 Sync result recorded in database")
-            
-        except Exception as e:
-            print(f"   ⚠️ Could not record sync result: {e}")
-    
-    def get_sync_statistics(self):
-        """Get sync statistics from database"""
-        if not self.conn:
-            return None
-        
-        try:
-            cursor = self.conn.execute("""
-                SELECT 
-                    COUNT(*) as total_syncs,
-                    COUNT(CASE WHEN status = 'success' THEN 1 END) as successful_syncs,
-                    AVG(CASE WHEN status = 'success' THEN processing_time END) as avg_time,
-                    MIN(sync_timestamp) as first_sync,
-                    MAX(sync_timestamp) as last_sync
-                FROM sync_history
-            """)
-            
-            result = cursor.fetchone()
-            if result:
-                total, success, avg_time, first, last = result
-                return {
-                    'total_syncs': total,
-                    'successful_syncs': success,
-                    'success_rate': (success / total * 100) if total > 0 else 0,
-                    'avg_processing_time': avg_time or 0,
-                    'first_sync': first,
-                    'last_sync': last
-                }
-        except Exception as e:
-            print(f"   ⚠️ Error getting statistics: {e}")
-        
-        return None
-
-    def map_bazarr_path_to_local(self, bazarr_path):
-        """Map a Bazarr server path to local Mac path"""
-        if not bazarr_path:
-            return None
-            
-        # Try direct mapping first
-        for server_path, local_path in self.path_mappings.items():
-            if bazarr_path.startswith(server_path):
-                local_mapped = bazarr_path.replace(server_path, local_path)
-                if os.path.exists(local_mapped):
-                    print(f"   ✅ Direct mapping found: {local_mapped}")
-                    return local_mapped
-        
-        # Try fuzzy matching by filename
-        filename = os.path.basename(bazarr_path)
-        print(f"   🔍 Searching for file: {filename}")
-        
-        for search_path in self.local_search_paths:
-            if not os.path.exists(search_path):
-                continue
-                
-            for root, dirs, files in os.walk(search_path):
-                if filename in files:
-                    found_path = os.path.join(root, filename)
-                    print(f"   ✅ Fuzzy match found: {found_path}")
-                    return found_path
-        
-        print(f"   ❌ No local mapping found for: {bazarr_path}")
-        return None
-    
-    def find_matching_subtitle(self, video_path, language="nl"):
-        """Find matching subtitle file for a video - ONLY original files, not synced"""
-        if not video_path or not os.path.exists(video_path):
-            return None
-            
-        video_dir = os.path.dirname(video_path)
-        video_base = os.path.splitext(os.path.basename(video_path))[0]
-        
-        # Look for original subtitles to sync (exclude synced files)
-        original_patterns = [
-            f"{video_base}.{language}.srt",
-            f"{video_base}.{language}.hi.srt",
-            f"{video_base}.{language}.forced.srt",
-            f"{video_base}.*.{language}.srt",
-            f"{video_base}.{language}.*.srt",
-        ]
-        
-        # If Dutch, try additional patterns
-        if language.lower() in ['nl', 'dutch', 'nederlands']:
-            original_patterns.extend([
-                f"{video_base}.dutch.srt",
-                f"{video_base}.nederlands.srt",
-                f"{video_base}.nld.srt",
-            ])
-        
-        for pattern in original_patterns:
-            matches = []
-            try:
-                import glob
-                full_pattern = os.path.join(video_dir, pattern)
-                matches = glob.glob(full_pattern)
-            except:
-                # Fallback to simple check
-                simple_path = os.path.join(video_dir, pattern)
-                if os.path.exists(simple_path):
-                    matches = [simple_path]
-            
-            if matches:
-                # Prefer non-HI subtitles
-                for match in matches:
-                    if '.hi.' not in match.lower() and '.synced.' not in match.lower():
-                        print(f"   ✅ Found subtitle to sync: {os.path.basename(match)}")
-                        return match
-                # Use any match as fallback
-                for match in matches:
-                    if '.synced.' not in match.lower():
-                        print(f"   ✅ Found subtitle (HI) to sync: {os.path.basename(matches[0])}")
-                        return matches[0]
-        
-        print(f"   ❌ No subtitle found for {os.path.basename(video_path)}")
-        return None
-    
-    def sync_using_simple_method(self, video_path, subtitle_path):
-        """Use the corrected ffsubsync method with smart sync tracking"""
-        print(f"   🎯 Starting Mac M1 sync process...")
-        print(f"   📹 Video: {os.path.basename(video_path)}")
-        print(f"   📄 Subtitle: {os.path.basename(subtitle_path)}")
-        
-        if not os.path.exists(video_path):
-            print(f"   ❌ Video file not found: {video_path}")
-            return False, "video_not_found"
-            
-        if not os.path.exists(subtitle_path):
-            print(f"   ❌ Subtitle file not found: {subtitle_path}")
-            return False, "subtitle_not_found"
-        
-        # Check if already synced
-        already_synced, synced_path = self.is_already_synced(video_path, subtitle_path)
-        if already_synced and synced_path:
-            print(f"   🎉 Subtitle already synced! Using: {os.path.basename(synced_path)}")
-            return True, "already_synced"
-        
-        # Show file sizes
-        try:
-            subtitle_size = os.path.getsize(subtitle_path) / 1024  # KB
-            video_size = os.path.getsize(video_path) / (1024**3)  # GB
-            print(f"   📊 Subtitle: {subtitle_size:.1f} KB, Video: {video_size:.1f} GB")
-        except:
-            pass
-        
-        # Create backup of original
-        backup_path = subtitle_path + '.backup'
-        if not os.path.exists(backup_path):
-            try:
-                shutil.copy2(subtitle_path, backup_path)
-                print(f"   💾 Backup created: {os.path.basename(backup_path)}")
-            except Exception as e:
-                print(f"   ⚠️ Could not create backup: {e}")
-        
-        # Create synced output path
-        synced_output_path = self.get_synced_subtitle_path(subtitle_path)
-        
-        # SIMPLIFIED ffsubsync command (remove problematic parameters)
-        cmd = [
-            'ffsubsync',
-            video_path,                    # POSITIONAL: Reference video file
-            '-i', subtitle_path,           # Input subtitle file
-            '-o', synced_output_path,      # Output subtitle file
-            '--vad', 'webrtc',             # Voice Activity Detection
-            '--max-offset-seconds', '60'   # Maximum offset (reduced)
-        ]
-        
-        print(f"   🔄 Running ffsubsync on Mac M1...")
-        print(f"   ⚙️ Command: ffsubsync [video] -i [subtitle] -o [output]")
-        print(f"   📁 Output: {os.path.basename(synced_output_path)}")
-        
-        try:
-            # M1-optimized timeout
-            timeout = max(300, int(video_size * 30) if 'video_size' in locals() else 300)
-            print(f"   ⏱️ Timeout: {timeout} seconds")
-            
-            start_time = time.time()
-            
-            # Run ffsubsync with real-time progress tracking
-            result = self._run_ffsubsync_with_progress(cmd, timeout)
-            
-            processing_time = time.time() - start_time
-            
-            print(f"\n   ⏱️ Processing completed in {processing_time:.1f} seconds")
-            print(f"   📟 Return code: {result.returncode}")
-            
-            if result.returncode == 0:
-                # Success!
-                if os.path.exists(synced_output_path) and os.path.getsize(synced_output_path) > 0:
-                    print(f"   ✅ Subtitle synchronized successfully!")
-                    print(f"   📁 Synced file: {os.path.basename(synced_output_path)}")
-                    
-                    # Extract sync info from output
-                    offset = 0.0
-                    if result.stdout:
-                        print(f"   📊 ffsubsync output:")
-                        stdout_lines = result.stdout.split('\n')
-                        for line in stdout_lines[:10]:  # Show first 10 lines
-                            line = line.strip()
-                            if line:
-                                print(f"      {line}")
-                                # Try to extract offset
-                                if 'offset' in line.lower() or 'shift' in line.lower():
-                                    try:
-                                        import re
-                                        numbers = re.findall(r'-?\d+\.?\d*', line)
-                                        if numbers:
-                                            offset = float(numbers[0])
-                                    except:
-                                        pass
-                    
-                    if result.stderr and result.stderr.strip():
-                        stderr_lines = result.stderr.split('\n')
-                        print(f"   📊 Processing info:")
-                        for line in stderr_lines[:5]:  # Show first 5 lines of stderr
-                            line = line.strip()
-                            if line and not line.startswith('WARNING'):
-                                print(f"      {line}")
-                    
-                    # Record successful sync in database
-                    self.record_sync_result(video_path, subtitle_path, synced_output_path, 
-                                          True, offset, processing_time, "ffsubsync_webrtc")
-                    
-                    # 🚀 AUTO-ARCHIVE INTEGRATION
-                    if hasattr(self, 'archive_manager') and self.archive_manager:
-                        try:
-                            print(f"   🗄️ Auto-archiving processed files...")
-                            archive_success, archive_status = self.archive_manager.archive_subtitle_files(
-                                video_path, subtitle_path
-                            )
-                            
-                            if archive_success:
-                                print(f"   ✅ Files archived successfully")
-                                return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archived"
-                            else:
-                                print(f"   ⚠️ Archive failed: {archive_status}")
-                                return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archive_failed"
-                        except Exception as e:
-                            print(f"   ❌ Archive error: {e}")
-                            return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archive_error"
-                    
-                    return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s"
-                else:
-                    print(f"   ❌ No synced output file created or file is empty")
-                    if result.stdout:
-                        print(f"   📊 stdout: {result.stdout[:200]}...")
-                    if result.stderr:
-                        print(f"   📊 stderr: {result.stderr[:200]}...")
-                    
-                    self.record_sync_result(video_path, subtitle_path, synced_output_path, 
-                                          False, 0, processing_time, "ffsubsync_no_output")
-                    return False, "no_output_file"
-                    
-            else:
-                print(f"   ❌ ffsubsync failed with return code: {result.returncode}")
-                
-                if result.stderr:
-                    error_msg = result.stderr[:400] + "..." if len(result.stderr) > 400 else result.stderr
-                    print(f"   📟 Error details:")
-                    for line in error_msg.split('\n')[:5]:
-                        if line.strip():
-                            print(f"      {line.strip()}")
-                
-                if result.stdout:
-                    output_msg = result.stdout[:200] + "..." if len(result.stdout) > 200 else result.stdout
-                    print(f"   📟 Output: {output_msg}")
-                
-                # Try alternative VAD methods if webrtcvad failed
-                if result.returncode != 0:
-                    print(f"   💡 Trying alternative VAD method...")
-                    return self._retry_with_alternative_vad(video_path, subtitle_path, synced_output_path, processing_time)
-                
-        except subprocess.TimeoutExpired:
-            print(f"   ❌ ffsubsync timed out after {timeout} seconds")
-            print(f"   💡 Large file - try increasing timeout or reducing analysis window")
-            self.record_sync_result(video_path, subtitle_path, synced_output_path, 
-                                  False, 0, timeout, "ffsubsync_timeout")
-            return False, f"timeout_{timeout}s"
-            
-        except Exception as e:
-            print(f"   ❌ Error running ffsubsync: {e}")
-            self.record_sync_result(video_path, subtitle_path, synced_output_path, 
-                                  False, 0, 0, f"ffsubsync_error_{str(e)[:30]}")
-            return False, f"error_{str(e)[:50]}"
-    
-    def _retry_with_alternative_vad(self, video_path, subtitle_path, output_path, original_time):
-        """Retry with alternative VAD method"""
-        print(f"   🔄 Retrying with auditok VAD...")
-        
-        # Try with auditok VAD (simplified)
-        cmd_alt = [
-            'ffsubsync',
-            video_path,
-            '-i', subtitle_path,
-            '-o', output_path,
-            '--vad', 'auditok',            # Alternative VAD
-            '--max-offset-seconds', '60'   # Reduced for retry
-        ]
-        
-        try:
-            start_time = time.time()
-            result = self._run_ffsubsync_with_progress(cmd_alt, 300)
-            processing_time = time.time() - start_time
-            
-            print(f"\n   ⏱️ Alternative VAD completed in {processing_time:.1f} seconds")
-            print(f"   📟 Return code: {result.returncode}")
-            
-            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                print(f"   ✅ Success with auditok VAD!")
-                
-                # Show some output
-                if result.stdout:
-                    print(f"   📊 Output:")
-                    for line in result.stdout.split('\n')[:3]:
-                        if line.strip():
-                            print(f"      {line.strip()}")
-                
-                # Record successful sync
-                self.record_sync_result(video_path, subtitle_path, output_path, 
-                                      True, 0, processing_time, "ffsubsync_auditok")
-                
-                # 🚀 AUTO-ARCHIVE INTEGRATION FOR ALT VAD
-                if hasattr(self, 'archive_manager') and self.archive_manager:
-                    try:
-                        print(f"   🗄️ Auto-archiving processed files...")
-                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
-                            video_path, subtitle_path
-                        )
-                        
-                        if archive_success:
-                            print(f"   ✅ Files archived successfully")
-                            return True, f"success_alt_vad_time_{processing_time:.1f}s_archived"
-                        else:
-                            print(f"   ⚠️ Archive failed: {archive_status}")
-                            return True, f"success_alt_vad_time_{processing_time:.1f}s_archive_failed"
-                    except Exception as e:
-                        print(f"   ❌ Archive error: {e}")
-                        return True, f"success_alt_vad_time_{processing_time:.1f}s_archive_error"
-                
-                return True, f"success_alt_vad_time_{processing_time:.1f}s"
-            else:
-                print(f"   ❌ Alternative VAD also failed (code: {result.returncode})")
-                
-                # Try one more time with minimal options
-                print(f"   🔄 Final attempt with minimal options...")
-                return self._retry_minimal_command(video_path, subtitle_path, output_path)
-                
-        except subprocess.TimeoutExpired:
-            print(f"   ❌ Alternative VAD timed out")
-            return self._retry_minimal_command(video_path, subtitle_path, output_path)
-        except Exception as e:
-            print(f"   ❌ Alternative VAD error: {e}")
-            return self._retry_minimal_command(video_path, subtitle_path, output_path)
-    
-    def _retry_minimal_command(self, video_path, subtitle_path, output_path):
-        """Final retry with absolute minimal command"""
-        print(f"   🔄 Final attempt with minimal options...")
-        
-        # Absolute minimal command
-        cmd_minimal = [
-            'ffsubsync',
-            video_path,
-            '-i', subtitle_path,
-            '-o', output_path
-        ]
-        
-        try:
-            start_time = time.time()
-            result = self._run_ffsubsync_with_progress(cmd_minimal, 200)
-            processing_time = time.time() - start_time
-            
-            print(f"\n   ⏱️ Minimal command completed in {processing_time:.1f} seconds")
-            print(f"   📟 Return code: {result.returncode}")
-            
-            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                print(f"   ✅ Success with minimal command!")
-                
-                # Record successful sync
-                self.record_sync_result(video_path, subtitle_path, output_path, 
-                                      True, 0, processing_time, "ffsubsync_minimal")
-                
-                # 🚀 AUTO-ARCHIVE INTEGRATION FOR MINIMAL COMMAND
-                if hasattr(self, 'archive_manager') and self.archive_manager:
-                    try:
-                        print(f"   🗄️ Auto-archiving processed files...")
-                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
-                            video_path, subtitle_path
-                        )
-                        
-                        if archive_success:
-                            print(f"   ✅ Files archived successfully")
-                            return True, f"success_minimal_time_{processing_time:.1f}s_archived"
-                        else:
-                            print(f"   ⚠️ Archive failed: {archive_status}")
-                            return True, f"success_minimal_time_{processing_time:.1f}s_archive_failed"
-                    except Exception as e:
-                        print(f"   ❌ Archive error: {e}")
-                        return True, f"success_minimal_time_{processing_time:.1f}s_archive_error"
-                
-                return True, f"success_minimal_time_{processing_time:.1f}s"
-            else:
-                print(f"   ❌ All ffsubsync attempts failed")
-                
-                # Show final error details
-                if result.stderr:
-                    print(f"   📟 Final error: {result.stderr[:200]}...")
-                
-                # Record failed sync
-                self.record_sync_result(video_path, subtitle_path, output_path, 
-                                      False, 0, processing_time, "ffsubsync_all_failed")
-                
-                return False, "all_attempts_failed"
-                
-        except Exception as e:
-            print(f"   ❌ Minimal command error: {e}")
-            self.record_sync_result(video_path, subtitle_path, output_path, 
-                                  False, 0, 0, "ffsubsync_minimal_error")
-            return False, "minimal_error"
-    
-    def sync_movie_hybrid(self, movie_data, language="nl"):
-        """Hybrid sync: Use Bazarr for discovery, Mac M1 for processing"""
-        print(f"\n🎬 HYBRID SYNC: {movie_data.get('title', 'Unknown')}")
-        print("=" * 60)
-        
-        # Step 1: Map Bazarr path to local path
-        bazarr_video_path = movie_data.get('path')
-        if not bazarr_video_path:
-            print(f"   ❌ No video path in Bazarr data")
-            return False, "no_bazarr_path"
-        
-        print(f"   🌐 Bazarr path: {bazarr_video_path}")
-        local_video_path = self.map_bazarr_path_to_local(bazarr_video_path)
-        
-        if not local_video_path:
-            print(f"   ❌ Could not map to local path")
-            return False, "path_mapping_failed"
-        
-        print(f"   📁 Local path: {local_video_path}")
-        
-        # Check if movie already has synced subtitle
-        video_base = os.path.splitext(local_video_path)[0]
-        print(f"🔍 DEBUG: Checking for existing synced movie files...")
-        print(f"🔍 DEBUG: Video base: {video_base}")
-        
-        potential_synced_files = [
-            f"{video_base}.{language}.synced.srt",
-            f"{video_base}.synced.{language}.srt", 
-            f"{video_base}.{language}.hi.synced.srt"
-        ]
-        
-        print(f"🔍 DEBUG: Checking {len(potential_synced_files)} potential synced files:")
-        for i, synced_file in enumerate(potential_synced_files, 1):
-            exists = os.path.exists(synced_file)
-            print(f"🔍 DEBUG: {i}. {exists} - {synced_file}")
-            if exists:
-                print(f"   🎉 Movie already synced: {os.path.basename(synced_file)}")
-                return True, "already_synced"
-        
-        # Step 2: Find matching subtitle
-        subtitle_path = self.find_matching_subtitle(local_video_path, language)
-        
-        if not subtitle_path:
-            print(f"   ❌ No subtitle found for language '{language}'")
-            return False, f"no_subtitle_{language}"
-        
-        # Step 3: Use Mac M1 power for actual sync
-        return self.sync_using_simple_method(local_video_path, subtitle_path)
-    
-    def show_sync_statistics(self):
-        """Display sync statistics from database"""
-        stats = self.get_sync_statistics()
-        if not stats:
-            print("   📊 No sync statistics available")
-            return
-        
-        print(f"\n📊 SYNC STATISTICS")
-        print("=" * 50)
-        print(f"Total syncs: {stats['total_syncs']}")
-        print(f"Successful: {stats['successful_syncs']} ({stats['success_rate']:.1f}%)")
-        print(f"Average processing time: {stats['avg_processing_time']:.1f} seconds")
-        if stats['first_sync']:
-            print(f"First sync: {stats['first_sync']}")
-        if stats['last_sync']:
-            print(f"Last sync: {stats['last_sync']}")
-    
-    def sync_movie_hybrid(self, media_item, language="nl"):
-        """Enhanced hybrid sync with auto-archive integration"""
-        try:
-            print(f"\n🎬 HYBRID SYNC: {media_item.get('title', 'Unknown')}")
-            print("=" * 60)
-
-            # Step 1: Map Bazarr path to local path
-            bazarr_video_path = media_item.get('path')
-            if not bazarr_video_path:
-                print(f"   ❌ No video path in Bazarr data")
-                return False, "no_bazarr_path"
-
-            print(f"   🌐 Bazarr path: {bazarr_video_path}")
-            
-            # Find the actual local file using fuzzy matching
-            local_video_path = self._find_local_video_file(bazarr_video_path)
-            
-            if not local_video_path:
-                print(f"   ❌ Could not find local video file")
-                return False, "local_file_not_found"
-            
-            print(f"   📁 Local path: {local_video_path}")
-            
-            # Check if movie already has synced subtitle
-            video_base = os.path.splitext(local_video_path)[0]
-            potential_synced_files = [
-                f"{video_base}.{language}.synced.srt",
-                f"{video_base}.synced.{language}.srt", 
-                f"{video_base}.{language}.hi.synced.srt"
-            ]
-            
-            for synced_file in potential_synced_files:
-                if os.path.exists(synced_file):
-                    print(f"   🎉 Movie already synced: {os.path.basename(synced_file)}")
-                    return True, "already_synced"
-            
-            # Step 2: Find subtitle file
-            subtitle_path = self._find_subtitle_file(local_video_path, language)
-            if not subtitle_path:
-                print(f"   ❌ No {language} subtitle found")
-                return False, f"no_{language}_subtitle"
-            
-            print(f"   ✅ Found subtitle to sync: {os.path.basename(subtitle_path)}")
-            
-            # Step 3: Perform sync using Mac M1 processing
-            print(f"   🎯 Starting Mac M1 sync process...")
-            
-            video_name = os.path.basename(local_video_path)
-            subtitle_name = os.path.basename(subtitle_path)
-            
-            print(f"   📹 Video: {video_name}")
-            print(f"   📄 Subtitle: {subtitle_name}")
-            
-            # Show file sizes
-            try:
-                video_size = os.path.getsize(local_video_path) / (1024**3)  # GB
-                subtitle_size = os.path.getsize(subtitle_path) / 1024  # KB
-                print(f"   📊 Subtitle: {subtitle_size:.1f} KB, Video: {video_size:.1f} GB")
-            except:
-                pass
-            
-            # Create backup of original subtitle
-            backup_path = subtitle_path + ".backup"
-            if not os.path.exists(backup_path):
-                import shutil
-                shutil.copy2(subtitle_path, backup_path)
-                print(f"   💾 Backup created: {os.path.basename(backup_path)}")
-            
-            # Generate output path
-            output_path = subtitle_path.replace('.srt', '.synced.srt')
-            
-            # Run ffsubsync
-            print(f"   🔄 Running ffsubsync on Mac M1...")
-            success, sync_time, return_code, error_output = self._run_ffsubsync(
-                local_video_path, subtitle_path, output_path
-            )
-            
-            if success:
-                print(f"   ✅ Sync completed successfully!")
-                status = f"success_time_{sync_time:.1f}s"
-                
-                # Clean up any temporary extracted files
-                try:
-                    if self.translator and self.config and self.config.get('cleanup_extracted_subtitles', True):
-                        self.translator.cleanup_extracted_files(local_video_path)
-                except Exception as e:
-                    print(f"   ⚠️ Cleanup warning: {e}")
-                
-                # Record sync in database
-                self._record_sync_result(
-                    video_path=local_video_path,
-                    subtitle_path=subtitle_path,
-                    output_path=output_path,
-                    language=language,
-                    success=True,
-                    processing_time=sync_time,
-                    method="hybrid_mac"
-                )
-                
-                # 🚀 AUTO-ARCHIVE INTEGRATION
-                if hasattr(self, 'archive_manager') and self.archive_manager:
-                    try:
-                        print(f"   🗄️ Auto-archiving processed files...")
-                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
-                            local_video_path, subtitle_path
-                        )
-                        
-                        if archive_success:
-                            print(f"   ✅ Files archived successfully")
-                            status += "_archived"
-                        else:
-                            print(f"   ⚠️ Archive failed: {archive_status}")
-                            status += "_archive_failed"
-                            
-                    except Exception as e:
-                        print(f"   ⚠️ Archive error (non-critical): {e}")
-                        status += "_archive_error"
-                else:
-                    print(f"   ⚠️ Archive manager not available")
-                
-                return True, status
-            else:
-                print(f"   ❌ ffsubsync failed with return code: {return_code}")
-                if error_output:
-                    print(f"   📟 Error details:")
-                    for line in error_output.split('\n')[:5]:  # Show first 5 lines
-                        if line.strip():
-                            print(f"      {line.strip()}")
-                
-                # Try alternative VAD method
-                print(f"   💡 Trying alternative VAD method...")
-                alt_success, alt_time = self._try_alternative_vad(
-                    local_video_path, subtitle_path, output_path
-                )
-                
-                if alt_success:
-                    print(f"   ✅ Success with auditok VAD!")
-                    
-                    # Record sync result
-                    self._record_sync_result(
-                        video_path=local_video_path,
-                        subtitle_path=subtitle_path,
-                        output_path=output_path,
-                        language=language,
-                        success=True,
-                        processing_time=alt_time,
-                        method="hybrid_alt_vad"
-                    )
-                    
-                    status = f"success_alt_vad_time_{alt_time:.1f}s"
-                    
-                    # 🚀 AUTO-ARCHIVE INTEGRATION FOR ALT VAD
-                    if hasattr(self, 'archive_manager') and self.archive_manager:
-                        try:
-                            print(f"   🗄️ Auto-archiving processed files...")
-                            archive_success, archive_status = self.archive_manager.archive_subtitle_files(
-                                local_video_path, subtitle_path
-                            )
-                            
-                            if archive_success:
-                                print(f"   ✅ Files archived successfully")
-                                status += "_archived"
-                            else:
-                                print(f"   ⚠️ Archive failed: {archive_status}")
-                        except Exception as e:
-                            print(f"   ⚠️ Archive error: {e}")
-                    
-                    return True, status
-                else:
-                    return False, f"sync_failed_code_{return_code}"
-                    
-        except Exception as e:
-            self.logger.error(f"Hybrid sync error: {e}")
-            return False, f"sync_error: {str(e)}"
-
-    def _find_local_video_file(self, bazarr_path):
-        """Find local video file using fuzzy matching"""
-        # Extract filename from Bazarr path
-        bazarr_filename = os.path.basename(bazarr_path)
-        
-        print(f"   🔍 Searching for file: {bazarr_filename}")
-        
-        # Map Bazarr path to local base path
-        local_path = self.map_bazarr_path_to_local(bazarr_path)
-        
-        if local_path and os.path.exists(local_path):
-            print(f"   ✅ Direct match found: {local_path}")
-            return local_path
-        
-        # Try fuzzy matching in the directory
-        if local_path:
-            local_dir = os.path.dirname(local_path)
-            if os.path.exists(local_dir):
-                for file in os.listdir(local_dir):
-                    if file.lower().endswith(('.mkv', '.mp4', '.avi', '.m4v', '.mov')):
-                        # Check if filenames are similar
-                        if self._files_match(bazarr_filename, file):
-                            fuzzy_path = os.path.join(local_dir, file)
-                            print(f"   ✅ Fuzzy match found: {fuzzy_path}")
-                            return fuzzy_path
-        
-        return None
-
-    def _files_match(self, bazarr_filename, local_filename):
-        """Check if two filenames are similar enough to be the same file"""
-        # Remove extensions and normalize
-        bazarr_base = os.path.splitext(bazarr_filename)[0].lower()
-        local_base = os.path.splitext(local_filename)[0].lower()
-        
-        # Simple similarity check
-        return bazarr_base == local_base or bazarr_base in local_base or local_base in bazarr_base
-
-    def _find_subtitle_file(self, video_path, language):
-        """Find subtitle file for the video, with translation fallback"""
-        video_dir = os.path.dirname(video_path)
-        video_base = os.path.splitext(os.path.basename(video_path))[0]
-        
-        # Step 1: Look for existing subtitles in target language
-        print(f"🔍 Looking for {language} subtitles...")
-        
-        # Common subtitle patterns for target language
-        patterns = [
-            f"{video_base}.{language}.srt",
-            f"{video_base}.{language}.sub",
-            f"{video_base}.srt",
-            f"{video_base}.sub"
-        ]
-        
-        for pattern in patterns:
-            subtitle_path = os.path.join(video_dir, pattern)
-            if os.path.exists(subtitle_path):
-                print(f"   ✅ Found existing subtitle: {os.path.basename(subtitle_path)}")
-                return subtitle_path
-        
-        # Step 2: Translation fallback - only if enabled and translator available
-        print(f"   ❌ No {language} subtitles found")
-        
-        if not self.translator:
-            print(f"   ⚠️ Auto-translation disabled")
-            return None
-        
-        print(f"🌐 Attempting automatic translation...")
-        
-        try:
-            target_lang = language
-            if self.config:
-                target_lang = self.config.get('translation_target_language', language)
-            
-            translated_subtitle = self.translator.find_and_translate_subtitles(video_path, target_lang)
-            if translated_subtitle:
-                print(f"   ✅ Generated translated subtitle: {os.path.basename(translated_subtitle)}")
-                return translated_subtitle
-            else:
-                print(f"   ❌ Translation failed - no suitable source subtitles found")
-        except Exception as e:
-            print(f"   ❌ Translation error: {e}")
-        
-        return None
-
-    def _run_ffsubsync(self, video_path, subtitle_path, output_path):
-        """Run ffsubsync command"""
-        import subprocess
-        import time
-        
-        cmd = [
-            "ffsubsync",
-            video_path,
-            "-i", subtitle_path,
-            "-o", output_path,
-            "--max-subtitle-seconds", "600",
-            "--start-seconds", "0"
-        ]
-        
-        print(f"   ⚙️ Command: ffsubsync [video] -i [subtitle] -o [output]")
-        print(f"   📁 Output: {os.path.basename(output_path)}")
-        print(f"   ⏱️ Timeout: 300 seconds")
-        
-        start_time = time.time()
-        
-        try:
-            result = self._run_ffsubsync_with_progress(cmd, 300)
-            
-            processing_time = time.time() - start_time
-            print(f"\n   ⏱️ Processing completed in {processing_time:.1f} seconds")
-            print(f"   📟 Return code: {result.returncode}")
-            
-            if result.returncode == 0 and os.path.exists(output_path):
-                return True, processing_time, result.returncode, None
-            else:
-                return False, processing_time, result.returncode, result.stderr
-                
-        except subprocess.TimeoutExpired:
-            return False, 300, -1, "Timeout expired"
-        except Exception as e:
-            return False, 0, -1, str(e)
-
-    def _try_alternative_vad(self, video_path, subtitle_path, output_path):
-        """Try alternative VAD method (auditok)"""
-        import subprocess
-        import time
-        
-        print(f"   🔄 Retrying with auditok VAD...")
-        
-        cmd = [
-            "ffsubsync",
-            video_path,
-            "-i", subtitle_path,
-            "-o", output_path,
-            "--vad", "auditok",
-            "--max-subtitle-seconds", "600"
-        ]
-        
-        start_time = time.time()
-        
-        try:
-            result = self._run_ffsubsync_with_progress(
-                cmd,
-                600  # Longer timeout for alt VAD
-            )
-            
-            processing_time = time.time() - start_time
-            print(f"\n   ⏱️ Alternative VAD completed in {processing_time:.1f} seconds")
-            print(f"   📟 Return code: {result.returncode}")
-            
-            if result.returncode == 0 and os.path.exists(output_path):
-                return True, processing_time
-            else:
-                return False, processing_time
-                
-        except Exception as e:
-            return False, 0
-
-    def _run_ffsubsync_with_progress(self, cmd, timeout):
-        """Run ffsubsync command with real-time progress tracking"""
-        import subprocess
-        import threading
-        import re
-        import sys
-        
-        try:
-            # Start the process
-            process = subprocess.Popen(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True
-            )
-            
-            # Progress tracking variables
-            progress_data = {
-                'current': 0.0,
-                'total': 0.0,
-                'stage': 'Starting...',
-                'last_line': ''
-            }
-            
-            def update_progress():
-                """Update progress bar display"""
-                current = progress_data['current']
-                total = progress_data['total']
-                stage = progress_data['stage']
-                
-                if total > 0:
-                    percentage = min(100, (current / total) * 100)
-                    # Create progress bar
-                    bar_length = 30
-                    filled_length = int(bar_length * percentage / 100)
-                    bar = '█' * filled_length + '░' * (bar_length - filled_length)
-                    
-                    # Print progress (with carriage return to overwrite)
-                    print(f"\r   📊 Progress: [{bar}] {percentage:.1f}% - {stage}", end='', flush=True)
-                else:
-                    print(f"\r   📊 {stage}", end='', flush=True)
-            
-            # Read output line by line
-            output_lines = []
-            
-            try:
-                for line in process.stdout:
-                    output_lines.append(line)
-                    line = line.strip()
-                    
-                    if line:
-                        progress_data['last_line'] = line
-                        
-                        # Parse ffsubsync output for progress information
-                        # Look for patterns like: "3%|▎ | 100.0/2929.302 [00:01<00:31, 88.95it/s]"
-                        if '|' in line and ('/[' in line or '/sec' in line):
-                            try:
-                                # Extract current/total from pattern like "100.0/2929.302"
-                                match = re.search(r'(\d+\.?\d*)/(\d+\.?\d*)', line)
-                                if match:
-                                    progress_data['current'] = float(match.group(1))
-                                    progress_data['total'] = float(match.group(2))
-                                    progress_data['stage'] = 'Processing audio...'
-                                    update_progress()
-                                
-                                # Also look for percentage at start of line
-                                percentage_match = re.search(r'^(\d+)%', line)
-                                if percentage_match:
-                                    percentage = float(percentage_match.group(1))
-                                    progress_data['current'] = percentage
-                                    progress_data['total'] = 100
-                                    progress_data['stage'] = 'Processing audio...'
-                                    update_progress()
-                            except (ValueError, AttributeError):
-                                pass
-                        
-                        # Look for other status messages
-                        elif 'extracting speech segments' in line.lower():
-                            progress_data['stage'] = 'Extracting speech segments...'
-                            update_progress()
-                        elif 'aligning' in line.lower():
-                            progress_data['stage'] = 'Aligning subtitles...'
-                            update_progress()
-                        elif 'writing' in line.lower():
-                            progress_data['stage'] = 'Writing output...'
-                            update_progress()
-                        elif 'info' in line.lower() and 'extracting' in line.lower():
-                            progress_data['stage'] = 'Extracting speech...'
-                            update_progress()
-                        elif 'computing' in line.lower():
-                            progress_data['stage'] = 'Computing alignment...'
-                            update_progress()
-                
-                # Wait for process to complete
-                process.wait(timeout=timeout)
-                
-            except subprocess.TimeoutExpired:
-                process.kill()
-                raise subprocess.TimeoutExpired(cmd, timeout)
-            
-            # Final progress update
-            if progress_data['total'] > 0:
-                progress_data['current'] = progress_data['total']
-                progress_data['stage'] = 'Complete!'
-                update_progress()
-            
-            print()  # New line after progress bar
-            
-            # Create a result object similar to subprocess.run
-            class ProcessResult:
-                def __init__(self, returncode, stdout):
-                    self.returncode = returncode
-                    self.stdout = stdout
-                    self.stderr = ''
-            
-            return ProcessResult(process.returncode, ''.join(output_lines))
-            
-        except Exception as e:
-            print(f"\n   ❌ Error during progress tracking: {e}")
-            # Fallback to regular subprocess.run
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-
-    def _record_sync_result(self, video_path, subtitle_path, output_path, language, success, processing_time, method):
-        """Record sync result in database"""
-        if not hasattr(self, 'conn') or not self.conn:
-            return
-        
-        try:
-            import datetime
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            self.conn.execute("""
-                INSERT INTO sync_history 
-                (video_path, subtitle_path, output_path, language, success, processing_time, method, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (video_path, subtitle_path, output_path, language, success, processing_time, method, timestamp))
-            
-            self.conn.commit()
-            print(f"   📊 Sync result recorded in database")
-            
-        except Exception as e:
-            print(f"   ⚠️ Could not record sync result: {e}")
\ No newline at end of file
+"""
+Path Mapper - Maps Bazarr server paths to local Mac paths and handles sync coordination with tracking
+"""
+
+import atexit
+import datetime
+import fnmatch
+import functools
+import os
+from collections import OrderedDict
+import re
+import selectors
+import subprocess
+import shutil
+import time
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+# Import subtitle translator
+from subtitle_translator import SubtitleTranslator
+
+# Kernel-side file copy (sendfile with a copyfileobj fallback)
+from database_manager import _fast_copy
+
+# Content hashing is change detection, not security - prefer blake3
+# (SIMD, several times md5 throughput) when installed, else blake2b
+# which still beats md5 and ships with hashlib
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    from functools import partial
+    _content_hasher = partial(hashlib.blake2b, digest_size=16)
+
+# Subtitle filename templates tried by find_matching_subtitle, in
+# priority order; {base}/{lang} are substituted per video
+_SUBTITLE_TEMPLATES = (
+    "{base}.{lang}.srt",
+    "{base}.{lang}.hi.srt",
+    "{base}.{lang}.forced.srt",
+    "{base}.*.{lang}.srt",
+    "{base}.{lang}.*.srt",
+)
+
+# Extra spellings tried for Dutch
+_DUTCH_TEMPLATES = (
+    "{base}.dutch.srt",
+    "{base}.nederlands.srt",
+    "{base}.nld.srt",
+)
+
+# Compiled once - offset extraction from ffsubsync output runs per line
+_OFFSET_LINE_RE = re.compile(r'\b(offset|shift)\b', re.IGNORECASE)
+_OFFSET_RE = re.compile(r'-?\d+\.?\d*')
+
+# Byte-level patterns for the ffsubsync progress stream - the pipe is
+# read in binary, so lines are parsed without decoding; only matched
+# groups ever become str
+_PROG_RE = re.compile(rb'(\d+\.?\d*)/(\d+\.?\d*)')
+_PCT_RE = re.compile(rb'^(\d+)%')
+_STAGE_RE = re.compile(
+    rb'extracting speech segments|aligning|writing|computing|extracting',
+    re.IGNORECASE)
+_STAGE_LABELS = {
+    b'extracting speech segments': 'Extracting speech segments...',
+    b'aligning': 'Aligning subtitles...',
+    b'writing': 'Writing output...',
+    b'computing': 'Computing alignment...',
+    b'extracting': 'Extracting speech...',
+}
+
+# One exact string for the history insert so every execute hits the
+# connection's prepared-statement cache (matching is byte-for-byte)
+_INSERT_SYNC_SQL = (
+    "INSERT OR REPLACE INTO sync_history "
+    "(video_path, subtitle_path, synced_subtitle_path, video_hash, subtitle_hash, "
+    "sync_offset, processing_time, sync_method, status) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+@functools.lru_cache(maxsize=8192)
+def _listdir_set(directory):
+    """Cached frozenset of names in directory.
+
+    Existence checks against it are a set probe instead of a stat
+    syscall; batch runs hit the same parent directories hundreds of
+    times. Cleared when a sync writes new files (see record_sync_result).
+    """
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+def get_logger(name):
+    """Logger with a memory-buffered stdout handler.
+
+    Records pile up in a MemoryHandler and reach stdout in batches of
+    100 (warnings and errors flush the buffer immediately), so a bulk
+    run pays one write syscall per batch instead of one per message.
+    %s-style arguments are only formatted when a record is emitted.
+    """
+    import logging
+    import logging.handlers
+    import sys
+
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        target = logging.StreamHandler(sys.stdout)
+        target.setFormatter(logging.Formatter('%(message)s'))
+        memory = logging.handlers.MemoryHandler(
+            capacity=100, flushLevel=logging.WARNING, target=target)
+        logger.addHandler(memory)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        atexit.register(memory.close)  # close() flushes what's left
+    return logger
+
+# One PathMapper per worker process, built by the pool initializer -
+# a per-movie instance would leak a SQLite connection, a maintenance
+# thread and two atexit hooks for every movie handled
+_worker_mapper = None
+
+def _init_worker_mapper():
+    """Pool initializer: build this worker's PathMapper once.
+
+    SQLite connections and the Bazarr client don't pickle, so each
+    worker builds its own mapper; WAL mode makes the shared history
+    database safe to write from several processes.
+    """
+    global _worker_mapper
+    from config import config
+    _worker_mapper = PathMapper(None, config)
+
+def _sync_one_movie(movie_data, language):
+    """Worker entry point: sync one movie on the per-process mapper"""
+    mapper = _worker_mapper
+    if mapper is None:  # direct call outside a pool
+        _init_worker_mapper()
+        mapper = _worker_mapper
+    try:
+        return mapper.sync_movie_hybrid(movie_data, language)
+    finally:
+        mapper.flush_sync_records()
+
+class PathMapper:
+    def __init__(self, bazarr_client, config=None):
+        self.bazarr_client = bazarr_client
+        self.logger = get_logger('PathMapper')
+        self.config = config
+        
+        # Initialize subtitle translator if enabled
+        auto_translation = True  # Default enabled
+        if config:
+            auto_translation = config.get('auto_translation', True)
+        
+        if auto_translation:
+            self.translator = SubtitleTranslator(config)
+        else:
+            self.translator = None
+        
+        # Path mapping rules
+        self.path_mappings = {
+            # Bazarr server paths -> Local Mac paths
+            "/PlexMedia/Movies": "/Volumes/Data/Movies",
+            "/PlexMedia/TVShows": "/Volumes/Data/TVShows",
+            "/PlexMedia/Cartoons": "/Volumes/Data/Cartoons",
+            "/PlexMedia/Documentaries": "/Volumes/Data/Documentaries", 
+            "/PlexMedia/Christmas": "/Volumes/Data/Christmas",
+            "/PlexMedia/Dive": "/Volumes/Data/Dive",
+        }
+        
+        # Alternative local search paths for movie content
+        self.local_search_paths = [
+            "/Volumes/Data/Movies",
+            "/Volumes/Data/TVShows",
+            "/Volumes/Data/Cartoons",
+            "/Volumes/Data/Documentaries",
+            "/Volumes/Data/Christmas",
+            "/Volumes/Data/Dive",
+            "/Volumes/Data",
+        ]
+        
+        # Initialize sync tracking database
+        self.init_sync_database()
+
+        # Buffered sync-history rows - flushed every _BATCH_SIZE writes,
+        # before any read that needs them, and at interpreter exit
+        self._pending_records = []
+        atexit.register(self.flush_sync_records)
+
+        # Hash results keyed by (path, mtime_ns, size) - a file whose
+        # stat signature is unchanged never gets its bytes re-read
+        self._hash_cache = OrderedDict()
+
+        # Longest-prefix-first view of path_mappings plus a cache of
+        # resolved paths - Bazarr re-sends identical paths constantly,
+        # so repeat lookups skip both the prefix scan and the exists probe
+        self._sorted_mappings = sorted(self.path_mappings.items(), key=lambda kv: -len(kv[0]))
+        self._mapping_cache = OrderedDict()
+
+        # Lazy filename -> full path index over local_search_paths,
+        # rebuilt after _FILE_INDEX_TTL seconds; turns every fuzzy-match
+        # miss from a full tree walk into a dict lookup
+        self._file_index = None
+        self._file_index_built_at = 0.0
+
+        # Background WAL maintenance - without periodic checkpoints the
+        # -wal file grows for the life of the process and read queries
+        # slowly degrade; a final checkpoint at exit leaves the database
+        # file self-contained
+        self._db_lock = threading.Lock()
+        if self.conn:
+            threading.Thread(target=self._db_maintenance_loop,
+                             daemon=True, name='sync-db-maintenance').start()
+            atexit.register(self._final_checkpoint)
+    
+    def init_sync_database(self):
+        """Initialize SQLite database for tracking sync history"""
+        try:
+            db_path = os.path.expanduser("~/subtitle_sync_history.db")
+            # Larger statement cache - history queries, pragmas and the
+            # batched insert together overflow the default 128 slots
+            # check_same_thread off: the maintenance thread below runs
+            # checkpoints on this connection (all writes hold _db_lock)
+            self.conn = sqlite3.connect(db_path, cached_statements=256,
+                                        check_same_thread=False)
+
+            # WAL lets statistics reads run against an active writer, and
+            # synchronous=NORMAL drops the per-insert fsync (safe in WAL:
+            # a crash can lose the last transactions but not corrupt).
+            # Set sync_db_durability to "full" in config to force FULL.
+            durability = "NORMAL"
+            if self.config and str(self.config.get('sync_db_durability', '')).lower() == 'full':
+                durability = "FULL"
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(f"PRAGMA synchronous={durability}")
+            # Wait out sibling writers (run_batch workers, the
+            # maintenance thread) instead of failing with 'locked'
+            self.conn.execute("PRAGMA busy_timeout=5000")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-20000")
+            self.conn.execute("PRAGMA mmap_size=268435456")
+
+            # Create sync history table
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    video_path TEXT NOT NULL,
+                    subtitle_path TEXT NOT NULL,
+                    synced_subtitle_path TEXT NOT NULL,
+                    video_hash TEXT,
+                    subtitle_hash TEXT,
+                    sync_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    sync_offset REAL,
+                    processing_time REAL,
+                    sync_method TEXT,
+                    status TEXT,
+                    UNIQUE(video_path, subtitle_path)
+                )
+            """)
+
+            # is_already_synced filters on the pair and orders by
+            # timestamp - this index serves the whole query as one walk,
+            # no sort step; the status index feeds the CASE aggregates
+            # in get_sync_statistics
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_vp_sp_ts
+                ON sync_history(video_path, subtitle_path, sync_timestamp DESC)
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_status
+                ON sync_history(status)
+            """)
+            self.conn.execute("ANALYZE")
+
+            self.conn.commit()
+
+            # In-memory success set - is_already_synced probes this before
+            # touching the filesystem or running SQL
+            self._synced_pairs = set(self.conn.execute(
+                "SELECT video_path, subtitle_path FROM sync_history WHERE status='success'"
+            ))
+
+            print(f"   📊 Sync tracking database initialized: {db_path}")
+            
+        except Exception as e:
+            print(f"   ⚠️ Could not initialize sync database: {e}")
+            self.conn = None
+            self._synced_pairs = set()
+    
+    _HASH_CACHE_MAX = 1024
+
+    def get_file_hash(self, file_path, sample_size=4*1024*1024):
+        """Get a quick hash of file (first 4MB) for change detection
+
+        Truncated to 32 hex chars, the same width the old md5 values had;
+        rows hashed before the switch simply mismatch once and trigger a
+        single re-sync check. Results are cached against the file's
+        (mtime, size), so repeat checks cost one stat, not a disk read.
+        """
+        try:
+            stat_info = os.stat(file_path)
+            key = (file_path, stat_info.st_mtime_ns, stat_info.st_size)
+            cached = self._hash_cache.get(key)
+            if cached is not None:
+                self._hash_cache.move_to_end(key)
+                return cached
+
+            hasher = _content_hasher()
+            with open(file_path, 'rb') as f:
+                hasher.update(f.read(sample_size))
+            digest = hasher.hexdigest()[:32]
+
+            self._hash_cache[key] = digest
+            if len(self._hash_cache) > self._HASH_CACHE_MAX:
+                self._hash_cache.popitem(last=False)
+            return digest
+        except:
+            return None
+    
+    def is_already_synced(self, video_path, subtitle_path):
+        """Check if subtitle is already synced and up to date"""
+        if not self.conn:
+            return False, None
+        
+        try:
+            synced_path = self.get_synced_subtitle_path(subtitle_path)
+
+            # Known-success pairs answer from memory: one set probe plus a
+            # cached directory listing, no flush and no SQL round-trip
+            if (video_path, subtitle_path) in self._synced_pairs:
+                if os.path.basename(synced_path) in _listdir_set(os.path.dirname(synced_path)):
+                    print(f"   ✅ Subtitle already synced (cached): {os.path.basename(synced_path)}")
+                    return True, synced_path
+                # Synced file vanished since it was recorded - fall through
+
+            # Make buffered writes visible before reading history
+            self.flush_sync_records()
+
+            # First check if .synced.srt file exists
+            if os.path.exists(synced_path):
+                print(f"   ✅ Found existing synced subtitle: {os.path.basename(synced_path)}")
+                
+                # Check database for sync details
+                cursor = self.conn.execute("""
+                    SELECT sync_timestamp, sync_offset, processing_time, sync_method, video_hash, subtitle_hash
+                    FROM sync_history 
+                    WHERE video_path = ? AND subtitle_path = ?
+                    ORDER BY sync_timestamp DESC LIMIT 1
+                """, (video_path, subtitle_path))
+                
+                result = cursor.fetchone()
+                if result:
+                    timestamp, offset, proc_time, method, old_video_hash, old_sub_hash = result
+                    
+                    # Check if files have changed since last sync
+                    current_video_hash = self.get_file_hash(video_path)
+                    current_sub_hash = self.get_file_hash(subtitle_path)
+                    
+                    if (current_video_hash == old_video_hash and 
+                        current_sub_hash == old_sub_hash):
+                        print(f"   ✅ Subtitle already synced on {timestamp}")
+                        print(f"   📊 Previous sync: offset={offset:.3f}s, time={proc_time:.1f}s, method={method}")
+                        return True, synced_path
+                    else:
+                        print(f"   ⚠️ Files changed since last sync - will re-sync")
+                else:
+                    print(f"   ⚠️ Synced file exists but no database record - will verify")
+                
+                return True, synced_path  # Use existing synced file anyway
+            
+            return False, None
+            
+        except Exception as e:
+            print(f"   ⚠️ Error checking sync status: {e}")
+            return False, None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _synced_path(original_subtitle_path):
+        """Derived synced path, memoized - the same subtitles come through
+        is_already_synced, sync and retry paths repeatedly"""
+        base_path = os.path.splitext(original_subtitle_path)[0]
+        return f"{base_path}.synced.srt"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _potential_synced_names(video_base, language):
+        """Candidate synced-subtitle paths for a video, memoized per video"""
+        return (
+            f"{video_base}.{language}.synced.srt",
+            f"{video_base}.synced.{language}.srt",
+            f"{video_base}.{language}.hi.synced.srt"
+        )
+
+    def get_synced_subtitle_path(self, original_subtitle_path):
+        """Get the path for the synced subtitle file"""
+        return self._synced_path(original_subtitle_path)
+
+    def _flush_logs(self):
+        """Push buffered log records to stdout now"""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
+    _BATCH_SIZE = 50
+
+    def record_sync_result(self, video_path, subtitle_path, synced_path, success, offset=0.0, processing_time=0.0, method="ffsubsync",
+                           video_hash=None, subtitle_hash=None):
+        """Record sync result (buffered; flushed in batches)
+
+        Callers that already hashed the files (sync_using_simple_method
+        does) can pass the digests in to skip the re-read here.
+        """
+        if not self.conn:
+            return
+        
+        try:
+            if video_hash is None:
+                video_hash = self.get_file_hash(video_path)
+            if subtitle_hash is None:
+                subtitle_hash = self.get_file_hash(subtitle_path)
+            
+            # The sync just created files (.synced.srt, backups) that
+            # cached directory listings don't know about yet
+            _listdir_set.cache_clear()
+
+            # Queue the row - one commit per batch instead of an fsync
+            # per sync keeps bulk runs off the disk's commit latency
+            self._pending_records.append((
+                video_path, subtitle_path, synced_path, video_hash, subtitle_hash,
+                offset, processing_time, method, "success" if success else "failed"
+            ))
+            if success:
+                self._synced_pairs.add((video_path, subtitle_path))
+            if len(self._pending_records) >= self._BATCH_SIZE:
+                self.flush_sync_records()
+            print(f"   📊 Sync result recorded in database")
+            
+        except Exception as e:
+            print(f"   ⚠️ Could not record sync result: {e}")
+
+    def flush_sync_records(self):
+        """Write any buffered sync records in a single transaction"""
+        if not self.conn or not self._pending_records:
+            return
+        
+        try:
+            with self._db_lock, self.conn:
+                self.conn.executemany(_INSERT_SYNC_SQL, self._pending_records)
+            self._pending_records.clear()
+        except Exception as e:
+            print(f"   ⚠️ Could not flush sync records: {e}")
+
+    _MAINTENANCE_INTERVAL = 300
+
+    def _db_maintenance_loop(self):
+        """Periodically fold the WAL back and refresh planner statistics"""
+        while True:
+            time.sleep(self._MAINTENANCE_INTERVAL)
+            if not self.conn:
+                return
+            try:
+                with self._db_lock:
+                    self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    self.conn.execute("PRAGMA optimize")
+            except Exception:
+                # Racing a writer or a closing connection - next pass
+                # tries again
+                pass
+
+    def _final_checkpoint(self):
+        """Checkpoint at shutdown so the database file is self-contained"""
+        if not self.conn:
+            return
+        try:
+            self.flush_sync_records()
+            with self._db_lock:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception:
+            pass
+    
+    def get_sync_statistics(self):
+        """Get sync statistics from database"""
+        if not self.conn:
+            return None
+        
+        try:
+            cursor = self.conn.execute("""
+                SELECT 
+                    COUNT(*) as total_syncs,
+                    COUNT(CASE WHEN status = 'success' THEN 1 END) as successful_syncs,
+                    AVG(CASE WHEN status = 'success' THEN processing_time END) as avg_time,
+                    MIN(sync_timestamp) as first_sync,
+                    MAX(sync_timestamp) as last_sync
+                FROM sync_history
+            """)
+            
+            result = cursor.fetchone()
+            if result:
+                total, success, avg_time, first, last = result
+                return {
+                    'total_syncs': total,
+                    'successful_syncs': success,
+                    'success_rate': (success / total * 100) if total > 0 else 0,
+                    'avg_processing_time': avg_time or 0,
+                    'first_sync': first,
+                    'last_sync': last
+                }
+        except Exception as e:
+            print(f"   ⚠️ Error getting statistics: {e}")
+        
+        return None
+
+    _MAPPING_CACHE_MAX = 4096
+
+    def _remember_mapping(self, bazarr_path, local_path):
+        """Cache a resolved path, evicting the oldest entry when full"""
+        self._mapping_cache[bazarr_path] = local_path
+        if len(self._mapping_cache) > self._MAPPING_CACHE_MAX:
+            self._mapping_cache.popitem(last=False)
+
+    def map_bazarr_path_to_local(self, bazarr_path):
+        """Map a Bazarr server path to local Mac path"""
+        if not bazarr_path:
+            return None
+
+        cached = self._mapping_cache.get(bazarr_path)
+        if cached is not None:
+            self._mapping_cache.move_to_end(bazarr_path)
+            return cached
+
+        # Try direct mapping first - most specific (longest) prefix wins
+        for server_path, local_path in self._sorted_mappings:
+            if bazarr_path.startswith(server_path):
+                local_mapped = local_path + bazarr_path[len(server_path):]
+                if os.path.basename(local_mapped) in _listdir_set(os.path.dirname(local_mapped)):
+                    print(f"   ✅ Direct mapping found: {local_mapped}")
+                    self._remember_mapping(bazarr_path, local_mapped)
+                    return local_mapped
+        
+        # Try fuzzy matching by filename against the cached index
+        filename = os.path.basename(bazarr_path)
+        print(f"   🔍 Searching for file: {filename}")
+
+        now = time.monotonic()
+        if self._file_index is None or now - self._file_index_built_at > self._FILE_INDEX_TTL:
+            self._file_index = self._build_file_index()
+            self._file_index_built_at = now
+
+        found_path = self._file_index.get(filename)
+        if found_path:
+            print(f"   ✅ Fuzzy match found: {found_path}")
+            self._remember_mapping(bazarr_path, found_path)
+            return found_path
+
+        print(f"   ❌ No local mapping found for: {bazarr_path}")
+        return None
+
+    _FILE_INDEX_TTL = 300
+
+    def _build_file_index(self):
+        """Build a filename -> full path map over the search paths.
+
+        One scandir pass per directory (DirEntry answers is_dir from the
+        cached stat), walked once per TTL window, so N missed paths cost
+        one traversal instead of N full os.walk runs. Search paths are
+        indexed in priority order and the first hit per name wins.
+        """
+        index = {}
+        for search_path in self.local_search_paths:
+            stack = [search_path]
+            while stack:
+                current = stack.pop()
+                try:
+                    it = os.scandir(current)
+                except OSError:
+                    continue
+                with it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            index.setdefault(entry.name, entry.path)
+        return index
+    
+    def find_matching_subtitle(self, video_path, language="nl"):
+        """Find matching subtitle file for a video - ONLY original files, not synced"""
+        if not video_path or not os.path.exists(video_path):
+            return None
+            
+        video_dir = os.path.dirname(video_path)
+        video_base = os.path.splitext(os.path.basename(video_path))[0]
+        
+        # Look for original subtitles to sync (exclude synced files)
+        templates = _SUBTITLE_TEMPLATES
+        if language.lower() in ['nl', 'dutch', 'nederlands']:
+            templates = templates + _DUTCH_TEMPLATES
+
+        # Compile every pattern once and classify the directory in a
+        # single scandir pass - glob.glob would relist the directory and
+        # retranslate the pattern for each template
+        patterns = [
+            re.compile(fnmatch.translate(t.format(base=video_base, lang=language)),
+                       re.IGNORECASE)
+            for t in templates
+        ]
+        matches_by_pattern = [[] for _ in patterns]
+
+        try:
+            with os.scandir(video_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    for i, pattern in enumerate(patterns):
+                        if pattern.match(name):
+                            matches_by_pattern[i].append(os.path.join(video_dir, name))
+        except OSError:
+            print(f"   ❌ No subtitle found for {os.path.basename(video_path)}")
+            return None
+
+        for matches in matches_by_pattern:
+            if not matches:
+                continue
+            # Tokenize each filename once - set probes replace repeated
+            # substring scans over fresh lower() copies, and only exact
+            # dot-delimited parts count (no accidental hits inside words)
+            parts_by_match = [
+                (match, frozenset(os.path.basename(match).lower().split('.')))
+                for match in matches
+            ]
+            # Prefer non-HI subtitles
+            for match, parts in parts_by_match:
+                if 'hi' not in parts and 'synced' not in parts:
+                    print(f"   ✅ Found subtitle to sync: {os.path.basename(match)}")
+                    return match
+            # Use any match as fallback
+            for match, parts in parts_by_match:
+                if 'synced' not in parts:
+                    print(f"   ✅ Found subtitle (HI) to sync: {os.path.basename(matches[0])}")
+                    return matches[0]
+        
+        print(f"   ❌ No subtitle found for {os.path.basename(video_path)}")
+        return None
+    
+    def sync_using_simple_method(self, video_path, subtitle_path):
+        """Use the corrected ffsubsync method with smart sync tracking"""
+        log = self.logger
+        # Derived once - these get reused across the log lines below
+        vbase = os.path.basename(video_path)
+        sbase = os.path.basename(subtitle_path)
+        log.info("   🎯 Starting Mac M1 sync process...")
+        log.info("   📹 Video: %s", vbase)
+        log.info("   📄 Subtitle: %s", sbase)
+        
+        if not os.path.exists(video_path):
+            log.error("   ❌ Video file not found: %s", video_path)
+            return False, "video_not_found"
+            
+        if not os.path.exists(subtitle_path):
+            log.error("   ❌ Subtitle file not found: %s", subtitle_path)
+            return False, "subtitle_not_found"
+        
+        # Check if already synced
+        already_synced, synced_path = self.is_already_synced(video_path, subtitle_path)
+        if already_synced and synced_path:
+            log.info("   🎉 Subtitle already synced! Using: %s", os.path.basename(synced_path))
+            return True, "already_synced"
+        
+        # Hash once up front - is_already_synced usually just computed
+        # these, so both are cache hits; every record call below reuses
+        # them instead of re-reading multi-MB samples
+        video_hash = self.get_file_hash(video_path)
+        subtitle_hash = self.get_file_hash(subtitle_path)
+        
+        # Show file sizes
+        try:
+            subtitle_size = os.path.getsize(subtitle_path) / 1024  # KB
+            video_size = os.path.getsize(video_path) / (1024**3)  # GB
+            log.info("   📊 Subtitle: %.1f KB, Video: %.1f GB", subtitle_size, video_size)
+        except:
+            pass
+        
+        # Create backup of original
+        backup_path = subtitle_path + '.backup'
+        if not os.path.exists(backup_path):
+            try:
+                _fast_copy(subtitle_path, backup_path)
+                log.info("   💾 Backup created: %s", os.path.basename(backup_path))
+            except Exception as e:
+                log.warning("   ⚠️ Could not create backup: %s", e)
+        
+        # Create synced output path
+        synced_output_path = self.get_synced_subtitle_path(subtitle_path)
+        out_base = os.path.basename(synced_output_path)
+        
+        # SIMPLIFIED ffsubsync command (remove problematic parameters)
+        cmd = [
+            'ffsubsync',
+            video_path,                    # POSITIONAL: Reference video file
+            '-i', subtitle_path,           # Input subtitle file
+            '-o', synced_output_path,      # Output subtitle file
+            '--vad', 'webrtc',             # Voice Activity Detection
+            '--max-offset-seconds', '60'   # Maximum offset (reduced)
+        ]
+        
+        log.info("   🔄 Running ffsubsync on Mac M1...")
+        log.info("   ⚙️ Command: ffsubsync [video] -i [subtitle] -o [output]")
+        log.info("   📁 Output: %s", out_base)
+        
+        try:
+            # M1-optimized timeout
+            timeout = max(300, int(video_size * 30) if 'video_size' in locals() else 300)
+            log.info("   ⏱️ Timeout: %s seconds", timeout)
+            
+            start_time = time.time()
+            
+            # The progress bar below writes to stdout directly - drain
+            # the log buffer first so lines come out in order
+            self._flush_logs()
+            
+            # Run ffsubsync with real-time progress tracking
+            result = self._run_ffsubsync_with_progress(cmd, timeout)
+            
+            processing_time = time.time() - start_time
+            
+            log.info("\n   ⏱️ Processing completed in %.1f seconds", processing_time)
+            log.info("   📟 Return code: %s", result.returncode)
+            
+            if result.returncode == 0:
+                # Success!
+                if os.path.exists(synced_output_path) and os.path.getsize(synced_output_path) > 0:
+                    log.info("   ✅ Subtitle synchronized successfully!")
+                    log.info("   📁 Synced file: %s", out_base)
+                    
+                    # Extract sync info from output
+                    offset = 0.0
+                    if result.stdout:
+                        log.info("   📊 ffsubsync output:")
+                        stdout_lines = result.stdout.split('\n')
+                        for line in stdout_lines[:10]:  # Show first 10 lines
+                            line = line.strip()
+                            if line:
+                                log.info("      %s", line)
+                                # Try to extract offset
+                                if _OFFSET_LINE_RE.search(line):
+                                    try:
+                                        numbers = _OFFSET_RE.findall(line)
+                                        if numbers:
+                                            offset = float(numbers[0])
+                                    except:
+                                        pass
+                    
+                    if result.stderr and result.stderr.strip():
+                        stderr_lines = result.stderr.split('\n')
+                        log.info("   📊 Processing info:")
+                        for line in stderr_lines[:5]:  # Show first 5 lines of stderr
+                            line = line.strip()
+                            if line and not line.startswith('WARNING'):
+                                log.info("      %s", line)
+                    
+                    # Record successful sync in database
+                    self.record_sync_result(video_path, subtitle_path, synced_output_path, 
+                                          True, offset, processing_time, "ffsubsync_webrtc",
+                                          video_hash=video_hash, subtitle_hash=subtitle_hash)
+                    
+                    # 🚀 AUTO-ARCHIVE INTEGRATION
+                    if hasattr(self, 'archive_manager') and self.archive_manager:
+                        try:
+                            log.info("   🗄️ Auto-archiving processed files...")
+                            archive_success, archive_status = self.archive_manager.archive_subtitle_files(
+                                video_path, subtitle_path
+                            )
+                            
+                            if archive_success:
+                                log.info("   ✅ Files archived successfully")
+                                return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archived"
+                            else:
+                                log.warning("   ⚠️ Archive failed: %s", archive_status)
+                                return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archive_failed"
+                        except Exception as e:
+                            log.error("   ❌ Archive error: %s", e)
+                            return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s_archive_error"
+                    
+                    return True, f"success_offset_{offset:.3f}s_time_{processing_time:.1f}s"
+                else:
+                    log.error("   ❌ No synced output file created or file is empty")
+                    if result.stdout:
+                        log.info("   📊 stdout: %s...", result.stdout[:200])
+                    if result.stderr:
+                        log.info("   📊 stderr: %s...", result.stderr[:200])
+                    
+                    self.record_sync_result(video_path, subtitle_path, synced_output_path, 
+                                          False, 0, processing_time, "ffsubsync_no_output",
+                                          video_hash=video_hash, subtitle_hash=subtitle_hash)
+                    return False, "no_output_file"
+                    
+            else:
+                log.error("   ❌ ffsubsync failed with return code: %s", result.returncode)
+                
+                if result.stderr:
+                    error_msg = result.stderr[:400] + "..." if len(result.stderr) > 400 else result.stderr
+                    log.info("   📟 Error details:")
+                    for line in error_msg.split('\n')[:5]:
+                        if line.strip():
+                            log.info("      %s", line.strip())
+                
+                if result.stdout:
+                    output_msg = result.stdout[:200] + "..." if len(result.stdout) > 200 else result.stdout
+                    log.info("   📟 Output: %s", output_msg)
+                
+                # Try alternative VAD methods if webrtcvad failed
+                if result.returncode != 0:
+                    log.info("   💡 Trying alternative VAD method...")
+                    return self._retry_with_alternative_vad(video_path, subtitle_path, synced_output_path, processing_time)
+                
+        except subprocess.TimeoutExpired:
+            log.error("   ❌ ffsubsync timed out after %s seconds", timeout)
+            log.info("   💡 Large file - try increasing timeout or reducing analysis window")
+            self.record_sync_result(video_path, subtitle_path, synced_output_path, 
+                                  False, 0, timeout, "ffsubsync_timeout",
+                                  video_hash=video_hash, subtitle_hash=subtitle_hash)
+            return False, f"timeout_{timeout}s"
+            
+        except Exception as e:
+            log.error("   ❌ Error running ffsubsync: %s", e)
+            self.record_sync_result(video_path, subtitle_path, synced_output_path, 
+                                  False, 0, 0, f"ffsubsync_error_{str(e)[:30]}",
+                                  video_hash=video_hash, subtitle_hash=subtitle_hash)
+            return False, f"error_{str(e)[:50]}"
+    
+    def _retry_with_alternative_vad(self, video_path, subtitle_path, output_path, original_time):
+        """Retry with alternative VAD method"""
+        print(f"   🔄 Retrying with auditok VAD...")
+        
+        # Try with auditok VAD (simplified)
+        cmd_alt = [
+            'ffsubsync',
+            video_path,
+            '-i', subtitle_path,
+            '-o', output_path,
+            '--vad', 'auditok',            # Alternative VAD
+            '--max-offset-seconds', '60'   # Reduced for retry
+        ]
+        
+        try:
+            start_time = time.time()
+            result = self._run_ffsubsync_with_progress(cmd_alt, 300)
+            processing_time = time.time() - start_time
+            
+            print(f"\n   ⏱️ Alternative VAD completed in {processing_time:.1f} seconds")
+            print(f"   📟 Return code: {result.returncode}")
+            
+            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                print(f"   ✅ Success with auditok VAD!")
+                
+                # Show some output
+                if result.stdout:
+                    print(f"   📊 Output:")
+                    for line in result.stdout.split('\n')[:3]:
+                        if line.strip():
+                            print(f"      {line.strip()}")
+                
+                # Record successful sync
+                self.record_sync_result(video_path, subtitle_path, output_path, 
+                                      True, 0, processing_time, "ffsubsync_auditok")
+                
+                # 🚀 AUTO-ARCHIVE INTEGRATION FOR ALT VAD
+                if hasattr(self, 'archive_manager') and self.archive_manager:
+                    try:
+                        print(f"   🗄️ Auto-archiving processed files...")
+                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
+                            video_path, subtitle_path
+                        )
+                        
+                        if archive_success:
+                            print(f"   ✅ Files archived successfully")
+                            return True, f"success_alt_vad_time_{processing_time:.1f}s_archived"
+                        else:
+                            print(f"   ⚠️ Archive failed: {archive_status}")
+                            return True, f"success_alt_vad_time_{processing_time:.1f}s_archive_failed"
+                    except Exception as e:
+                        print(f"   ❌ Archive error: {e}")
+                        return True, f"success_alt_vad_time_{processing_time:.1f}s_archive_error"
+                
+                return True, f"success_alt_vad_time_{processing_time:.1f}s"
+            else:
+                print(f"   ❌ Alternative VAD also failed (code: {result.returncode})")
+                
+                # Try one more time with minimal options
+                print(f"   🔄 Final attempt with minimal options...")
+                return self._retry_minimal_command(video_path, subtitle_path, output_path)
+                
+        except subprocess.TimeoutExpired:
+            print(f"   ❌ Alternative VAD timed out")
+            return self._retry_minimal_command(video_path, subtitle_path, output_path)
+        except Exception as e:
+            print(f"   ❌ Alternative VAD error: {e}")
+            return self._retry_minimal_command(video_path, subtitle_path, output_path)
+    
+    def _retry_minimal_command(self, video_path, subtitle_path, output_path):
+        """Final retry with absolute minimal command"""
+        print(f"   🔄 Final attempt with minimal options...")
+        
+        # Absolute minimal command
+        cmd_minimal = [
+            'ffsubsync',
+            video_path,
+            '-i', subtitle_path,
+            '-o', output_path
+        ]
+        
+        try:
+            start_time = time.time()
+            result = self._run_ffsubsync_with_progress(cmd_minimal, 200)
+            processing_time = time.time() - start_time
+            
+            print(f"\n   ⏱️ Minimal command completed in {processing_time:.1f} seconds")
+            print(f"   📟 Return code: {result.returncode}")
+            
+            if result.returncode == 0 and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                print(f"   ✅ Success with minimal command!")
+                
+                # Record successful sync
+                self.record_sync_result(video_path, subtitle_path, output_path, 
+                                      True, 0, processing_time, "ffsubsync_minimal")
+                
+                # 🚀 AUTO-ARCHIVE INTEGRATION FOR MINIMAL COMMAND
+                if hasattr(self, 'archive_manager') and self.archive_manager:
+                    try:
+                        print(f"   🗄️ Auto-archiving processed files...")
+                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
+                            video_path, subtitle_path
+                        )
+                        
+                        if archive_success:
+                            print(f"   ✅ Files archived successfully")
+                            return True, f"success_minimal_time_{processing_time:.1f}s_archived"
+                        else:
+                            print(f"   ⚠️ Archive failed: {archive_status}")
+                            return True, f"success_minimal_time_{processing_time:.1f}s_archive_failed"
+                    except Exception as e:
+                        print(f"   ❌ Archive error: {e}")
+                        return True, f"success_minimal_time_{processing_time:.1f}s_archive_error"
+                
+                return True, f"success_minimal_time_{processing_time:.1f}s"
+            else:
+                print(f"   ❌ All ffsubsync attempts failed")
+                
+                # Show final error details
+                if result.stderr:
+                    print(f"   📟 Final error: {result.stderr[:200]}...")
+                
+                # Record failed sync
+                self.record_sync_result(video_path, subtitle_path, output_path, 
+                                      False, 0, processing_time, "ffsubsync_all_failed")
+                
+                return False, "all_attempts_failed"
+                
+        except Exception as e:
+            print(f"   ❌ Minimal command error: {e}")
+            self.record_sync_result(video_path, subtitle_path, output_path, 
+                                  False, 0, 0, "ffsubsync_minimal_error")
+            return False, "minimal_error"
+    
+    def sync_movie_hybrid(self, movie_data, language="nl"):
+        """Hybrid sync: Use Bazarr for discovery, Mac M1 for processing"""
+        print(f"\n🎬 HYBRID SYNC: {movie_data.get('title', 'Unknown')}")
+        print("=" * 60)
+        
+        # Step 1: Map Bazarr path to local path
+        bazarr_video_path = movie_data.get('path')
+        if not bazarr_video_path:
+            print(f"   ❌ No video path in Bazarr data")
+            return False, "no_bazarr_path"
+        
+        print(f"   🌐 Bazarr path: {bazarr_video_path}")
+        local_video_path = self.map_bazarr_path_to_local(bazarr_video_path)
+        
+        if not local_video_path:
+            print(f"   ❌ Could not map to local path")
+            return False, "path_mapping_failed"
+        
+        print(f"   📁 Local path: {local_video_path}")
+        
+        # Check if movie already has synced subtitle
+        video_base = os.path.splitext(local_video_path)[0]
+        print(f"🔍 DEBUG: Checking for existing synced movie files...")
+        print(f"🔍 DEBUG: Video base: {video_base}")
+        
+        potential_synced_files = self._potential_synced_names(video_base, language)
+
+        # One cached directory listing answers all three candidates
+        # instead of a stat call each
+        video_dir_names = _listdir_set(os.path.dirname(local_video_path))
+        print(f"🔍 DEBUG: Checking {len(potential_synced_files)} potential synced files:")
+        for i, synced_file in enumerate(potential_synced_files, 1):
+            synced_name = os.path.basename(synced_file)
+            exists = synced_name in video_dir_names
+            print(f"🔍 DEBUG: {i}. {exists} - {synced_file}")
+            if exists:
+                print(f"   🎉 Movie already synced: {synced_name}")
+                return True, "already_synced"
+        
+        # Step 2: Find matching subtitle
+        subtitle_path = self.find_matching_subtitle(local_video_path, language)
+        
+        if not subtitle_path:
+            print(f"   ❌ No subtitle found for language '{language}'")
+            return False, f"no_subtitle_{language}"
+        
+        # Step 3: Use Mac M1 power for actual sync
+        return self.sync_using_simple_method(local_video_path, subtitle_path)
+    
+    @classmethod
+    def run_batch(cls, movies, language="nl", workers=4):
+        """Sync many movies across a pool of worker processes.
+
+        ffsubsync is CPU-bound on voice activity detection, so movies
+        scale across cores; workers also caps how many ffmpeg decoders
+        hit the video disk at once. Returns {title: (success, status)}.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        print(f"\n🚀 BATCH SYNC: {len(movies)} movies on {workers} workers")
+        print("=" * 60)
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker_mapper) as executor:
+            futures = {
+                executor.submit(_sync_one_movie, movie, language):
+                    movie.get('title', 'Unknown')
+                for movie in movies
+            }
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    results[title] = future.result()
+                except Exception as e:
+                    print(f"   ❌ Worker error for {title}: {e}")
+                    results[title] = (False, f"worker_error_{str(e)[:50]}")
+
+        successful = sum(1 for success, _ in results.values() if success)
+        print(f"\n🏁 Batch complete: {successful}/{len(results)} successful")
+        return results
+
+    def show_sync_statistics(self):
+        """Display sync statistics from database"""
+        stats = self.get_sync_statistics()
+        if not stats:
+            print("   📊 No sync statistics available")
+            return
+        
+        print(f"\n📊 SYNC STATISTICS")
+        print("=" * 50)
+        print(f"Total syncs: {stats['total_syncs']}")
+        print(f"Successful: {stats['successful_syncs']} ({stats['success_rate']:.1f}%)")
+        print(f"Average processing time: {stats['avg_processing_time']:.1f} seconds")
+        if stats['first_sync']:
+            print(f"First sync: {stats['first_sync']}")
+        if stats['last_sync']:
+            print(f"Last sync: {stats['last_sync']}")
+    
+    def sync_movie_hybrid(self, media_item, language="nl"):
+        """Enhanced hybrid sync with auto-archive integration"""
+        try:
+            print(f"\n🎬 HYBRID SYNC: {media_item.get('title', 'Unknown')}")
+            print("=" * 60)
+
+            # Step 1: Map Bazarr path to local path
+            bazarr_video_path = media_item.get('path')
+            if not bazarr_video_path:
+                print(f"   ❌ No video path in Bazarr data")
+                return False, "no_bazarr_path"
+
+            print(f"   🌐 Bazarr path: {bazarr_video_path}")
+            
+            # Find the actual local file using fuzzy matching
+            local_video_path = self._find_local_video_file(bazarr_video_path)
+            
+            if not local_video_path:
+                print(f"   ❌ Could not find local video file")
+                return False, "local_file_not_found"
+            
+            print(f"   📁 Local path: {local_video_path}")
+            
+            # Check if movie already has synced subtitle
+            video_base = os.path.splitext(local_video_path)[0]
+            potential_synced_files = self._potential_synced_names(video_base, language)
+
+            # Single cached listing instead of one stat per candidate
+            video_dir_names = _listdir_set(os.path.dirname(local_video_path))
+            for synced_file in potential_synced_files:
+                synced_name = os.path.basename(synced_file)
+                if synced_name in video_dir_names:
+                    print(f"   🎉 Movie already synced: {synced_name}")
+                    return True, "already_synced"
+            
+            # Step 2: Find subtitle file
+            subtitle_path = self._find_subtitle_file(local_video_path, language)
+            if not subtitle_path:
+                print(f"   ❌ No {language} subtitle found")
+                return False, f"no_{language}_subtitle"
+            
+            print(f"   ✅ Found subtitle to sync: {os.path.basename(subtitle_path)}")
+            
+            # Step 3: Perform sync using Mac M1 processing
+            print(f"   🎯 Starting Mac M1 sync process...")
+            
+            video_name = os.path.basename(local_video_path)
+            subtitle_name = os.path.basename(subtitle_path)
+            
+            print(f"   📹 Video: {video_name}")
+            print(f"   📄 Subtitle: {subtitle_name}")
+            
+            # Show file sizes
+            try:
+                video_size = os.path.getsize(local_video_path) / (1024**3)  # GB
+                subtitle_size = os.path.getsize(subtitle_path) / 1024  # KB
+                print(f"   📊 Subtitle: {subtitle_size:.1f} KB, Video: {video_size:.1f} GB")
+            except:
+                pass
+            
+            # Create backup of original subtitle
+            backup_path = subtitle_path + ".backup"
+            if not os.path.exists(backup_path):
+                _fast_copy(subtitle_path, backup_path)
+                print(f"   💾 Backup created: {os.path.basename(backup_path)}")
+            
+            # Generate output path
+            output_path = subtitle_path.replace('.srt', '.synced.srt')
+            
+            # Run ffsubsync
+            print(f"   🔄 Running ffsubsync on Mac M1...")
+            success, sync_time, return_code, error_output = self._run_ffsubsync(
+                local_video_path, subtitle_path, output_path
+            )
+            
+            if success:
+                print(f"   ✅ Sync completed successfully!")
+                status = f"success_time_{sync_time:.1f}s"
+                
+                # Clean up any temporary extracted files
+                try:
+                    if self.translator and self.config and self.config.get('cleanup_extracted_subtitles', True):
+                        self.translator.cleanup_extracted_files(local_video_path)
+                except Exception as e:
+                    print(f"   ⚠️ Cleanup warning: {e}")
+                
+                # Record sync in database
+                self._record_sync_result(
+                    video_path=local_video_path,
+                    subtitle_path=subtitle_path,
+                    output_path=output_path,
+                    language=language,
+                    success=True,
+                    processing_time=sync_time,
+                    method="hybrid_mac"
+                )
+                
+                # 🚀 AUTO-ARCHIVE INTEGRATION
+                if hasattr(self, 'archive_manager') and self.archive_manager:
+                    try:
+                        print(f"   🗄️ Auto-archiving processed files...")
+                        archive_success, archive_status = self.archive_manager.archive_subtitle_files(
+                            local_video_path, subtitle_path
+                        )
+                        
+                        if archive_success:
+                            print(f"   ✅ Files archived successfully")
+                            status += "_archived"
+                        else:
+                            print(f"   ⚠️ Archive failed: {archive_status}")
+                            status += "_archive_failed"
+                            
+                    except Exception as e:
+                        print(f"   ⚠️ Archive error (non-critical): {e}")
+                        status += "_archive_error"
+                else:
+                    print(f"   ⚠️ Archive manager not available")
+                
+                return True, status
+            else:
+                print(f"   ❌ ffsubsync failed with return code: {return_code}")
+                if error_output:
+                    print(f"   📟 Error details:")
+                    for line in error_output.split('\n')[:5]:  # Show first 5 lines
+                        if line.strip():
+                            print(f"      {line.strip()}")
+                
+                # Try alternative VAD method
+                print(f"   💡 Trying alternative VAD method...")
+                alt_success, alt_time = self._try_alternative_vad(
+                    local_video_path, subtitle_path, output_path
+                )
+                
+                if alt_success:
+                    print(f"   ✅ Success with auditok VAD!")
+                    
+                    # Record sync result
+                    self._record_sync_result(
+                        video_path=local_video_path,
+                        subtitle_path=subtitle_path,
+                        output_path=output_path,
+                        language=language,
+                        success=True,
+                        processing_time=alt_time,
+                        method="hybrid_alt_vad"
+                    )
+                    
+                    status = f"success_alt_vad_time_{alt_time:.1f}s"
+                    
+                    # 🚀 AUTO-ARCHIVE INTEGRATION FOR ALT VAD
+                    if hasattr(self, 'archive_manager') and self.archive_manager:
+                        try:
+                            print(f"   🗄️ Auto-archiving processed files...")
+                            archive_success, archive_status = self.archive_manager.archive_subtitle_files(
+                                local_video_path, subtitle_path
+                            )
+                            
+                            if archive_success:
+                                print(f"   ✅ Files archived successfully")
+                                status += "_archived"
+                            else:
+                                print(f"   ⚠️ Archive failed: {archive_status}")
+                        except Exception as e:
+                            print(f"   ⚠️ Archive error: {e}")
+                    
+                    return True, status
+                else:
+                    return False, f"sync_failed_code_{return_code}"
+                    
+        except Exception as e:
+            self.logger.error(f"Hybrid sync error: {e}")
+            return False, f"sync_error: {str(e)}"
+
+    def _find_local_video_file(self, bazarr_path):
+        """Find local video file using fuzzy matching"""
+        # Extract filename from Bazarr path
+        bazarr_filename = os.path.basename(bazarr_path)
+        
+        print(f"   🔍 Searching for file: {bazarr_filename}")
+        
+        # Map Bazarr path to local base path
+        local_path = self.map_bazarr_path_to_local(bazarr_path)
+        
+        if local_path and os.path.exists(local_path):
+            print(f"   ✅ Direct match found: {local_path}")
+            return local_path
+        
+        # Try fuzzy matching in the directory
+        if local_path:
+            local_dir = os.path.dirname(local_path)
+            if os.path.exists(local_dir):
+                for file in os.listdir(local_dir):
+                    if file.lower().endswith(('.mkv', '.mp4', '.avi', '.m4v', '.mov')):
+                        # Check if filenames are similar
+                        if self._files_match(bazarr_filename, file):
+                            fuzzy_path = os.path.join(local_dir, file)
+                            print(f"   ✅ Fuzzy match found: {fuzzy_path}")
+                            return fuzzy_path
+        
+        return None
+
+    def _files_match(self, bazarr_filename, local_filename):
+        """Check if two filenames are similar enough to be the same file"""
+        # Remove extensions and normalize
+        bazarr_base = os.path.splitext(bazarr_filename)[0].lower()
+        local_base = os.path.splitext(local_filename)[0].lower()
+        
+        # Simple similarity check
+        return bazarr_base == local_base or bazarr_base in local_base or local_base in bazarr_base
+
+    def _find_subtitle_file(self, video_path, language):
+        """Find subtitle file for the video, with translation fallback"""
+        video_dir = os.path.dirname(video_path)
+        video_base = os.path.splitext(os.path.basename(video_path))[0]
+        
+        # Step 1: Look for existing subtitles in target language
+        print(f"🔍 Looking for {language} subtitles...")
+        
+        # Common subtitle patterns for target language
+        patterns = [
+            f"{video_base}.{language}.srt",
+            f"{video_base}.{language}.sub",
+            f"{video_base}.srt",
+            f"{video_base}.sub"
+        ]
+        
+        for pattern in patterns:
+            subtitle_path = os.path.join(video_dir, pattern)
+            if os.path.exists(subtitle_path):
+                print(f"   ✅ Found existing subtitle: {os.path.basename(subtitle_path)}")
+                return subtitle_path
+        
+        # Step 2: Translation fallback - only if enabled and translator available
+        print(f"   ❌ No {language} subtitles found")
+        
+        if not self.translator:
+            print(f"   ⚠️ Auto-translation disabled")
+            return None
+        
+        print(f"🌐 Attempting automatic translation...")
+        
+        try:
+            target_lang = language
+            if self.config:
+                target_lang = self.config.get('translation_target_language', language)
+            
+            translated_subtitle = self.translator.find_and_translate_subtitles(video_path, target_lang)
+            if translated_subtitle:
+                print(f"   ✅ Generated translated subtitle: {os.path.basename(translated_subtitle)}")
+                return translated_subtitle
+            else:
+                print(f"   ❌ Translation failed - no suitable source subtitles found")
+        except Exception as e:
+            print(f"   ❌ Translation error: {e}")
+        
+        return None
+
+    def _run_ffsubsync(self, video_path, subtitle_path, output_path):
+        """Run ffsubsync command"""
+        cmd = [
+            "ffsubsync",
+            video_path,
+            "-i", subtitle_path,
+            "-o", output_path,
+            "--max-subtitle-seconds", "600",
+            "--start-seconds", "0"
+        ]
+        
+        print(f"   ⚙️ Command: ffsubsync [video] -i [subtitle] -o [output]")
+        print(f"   📁 Output: {os.path.basename(output_path)}")
+        print(f"   ⏱️ Timeout: 300 seconds")
+        
+        start_time = time.time()
+        
+        try:
+            result = self._run_ffsubsync_with_progress(cmd, 300)
+            
+            processing_time = time.time() - start_time
+            print(f"\n   ⏱️ Processing completed in {processing_time:.1f} seconds")
+            print(f"   📟 Return code: {result.returncode}")
+            
+            if result.returncode == 0 and os.path.exists(output_path):
+                return True, processing_time, result.returncode, None
+            else:
+                return False, processing_time, result.returncode, result.stderr
+                
+        except subprocess.TimeoutExpired:
+            return False, 300, -1, "Timeout expired"
+        except Exception as e:
+            return False, 0, -1, str(e)
+
+    def _try_alternative_vad(self, video_path, subtitle_path, output_path):
+        """Try alternative VAD method (auditok)"""
+        print(f"   🔄 Retrying with auditok VAD...")
+        
+        cmd = [
+            "ffsubsync",
+            video_path,
+            "-i", subtitle_path,
+            "-o", output_path,
+            "--vad", "auditok",
+            "--max-subtitle-seconds", "600"
+        ]
+        
+        start_time = time.time()
+        
+        try:
+            result = self._run_ffsubsync_with_progress(
+                cmd,
+                600  # Longer timeout for alt VAD
+            )
+            
+            processing_time = time.time() - start_time
+            print(f"\n   ⏱️ Alternative VAD completed in {processing_time:.1f} seconds")
+            print(f"   📟 Return code: {result.returncode}")
+            
+            if result.returncode == 0 and os.path.exists(output_path):
+                return True, processing_time
+            else:
+                return False, processing_time
+                
+        except Exception as e:
+            return False, 0
+
+    # Keep only the end of the combined output around - that is where
+    # ffsubsync prints the offset, and unbounded capture of tqdm spam can
+    # run to megabytes on long movies
+    _OUTPUT_TAIL_MAX = 64 * 1024
+    _READ_CHUNK = 64 * 1024
+
+    def _run_ffsubsync_with_progress(self, cmd, timeout):
+        """Run ffsubsync command with real-time progress tracking"""
+        try:
+            # Byte-mode pipe: a few large os.read() calls replace per-line
+            # text decoding of thousands of tqdm updates
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # Combine stderr with stdout
+                bufsize=self._READ_CHUNK,
+                text=False
+            )
+
+            # Progress tracking variables
+            progress_data = {
+                'current': 0.0,
+                'total': 0.0,
+                'stage': 'Starting...',
+                'last_line': ''
+            }
+
+            def update_progress():
+                """Update progress bar display"""
+                current = progress_data['current']
+                total = progress_data['total']
+                stage = progress_data['stage']
+
+                if total > 0:
+                    percentage = min(100, (current / total) * 100)
+                    # Create progress bar
+                    bar_length = 30
+                    filled_length = int(bar_length * percentage / 100)
+                    bar = '\u2588' * filled_length + '\u2591' * (bar_length - filled_length)
+
+                    # Print progress (with carriage return to overwrite)
+                    print(f"\r   \U0001f4ca Progress: [{bar}] {percentage:.1f}% - {stage}", end='', flush=True)
+                else:
+                    print(f"\r   \U0001f4ca {stage}", end='', flush=True)
+
+            def handle_line(raw_line):
+                """Parse one complete output line for progress information"""
+                line = raw_line.strip()
+                if not line:
+                    return
+
+                # Parse ffsubsync output for progress information
+                # Look for patterns like: "3%|\u258e | 100.0/2929.302 [00:01<00:31, 88.95it/s]"
+                if b'|' in line and (b'/[' in line or b'/sec' in line):
+                    try:
+                        # Extract current/total from pattern like "100.0/2929.302"
+                        match = _PROG_RE.search(line)
+                        if match:
+                            progress_data['current'] = float(match.group(1).decode())
+                            progress_data['total'] = float(match.group(2).decode())
+                            progress_data['stage'] = 'Processing audio...'
+                            update_progress()
+
+                        # Also look for percentage at start of line
+                        percentage_match = _PCT_RE.match(line)
+                        if percentage_match:
+                            progress_data['current'] = float(percentage_match.group(1).decode())
+                            progress_data['total'] = 100
+                            progress_data['stage'] = 'Processing audio...'
+                            update_progress()
+                    except (ValueError, AttributeError):
+                        pass
+                    return
+
+                # Status messages: one combined scan instead of five
+                # substring tests over fresh lower() copies, with the
+                # stage label picked by dict dispatch
+                match = _STAGE_RE.search(line)
+                if match is None:
+                    return
+                keyword = match.group(0).lower()
+                if keyword == b'extracting' and b'info' not in line.lower():
+                    # Bare 'extracting' only counts on INFO log lines
+                    return
+                progress_data['stage'] = _STAGE_LABELS[keyword]
+                progress_data['last_line'] = line.decode('utf-8', errors='replace')
+                update_progress()
+
+            # Bounded ring buffer of the newest output plus a carry for the
+            # bytes since the last line break
+            tail = bytearray()
+            pending = bytearray()
+            deadline = time.monotonic() + timeout if timeout else None
+
+            stdout_fd = process.stdout.fileno()
+            os.set_blocking(stdout_fd, False)
+            selector = selectors.DefaultSelector()
+            selector.register(process.stdout, selectors.EVENT_READ)
+
+            try:
+                eof = False
+                while not eof:
+                    if deadline is not None and time.monotonic() > deadline:
+                        process.kill()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+
+                    if not selector.select(timeout=0.5):
+                        continue
+
+                    while True:
+                        try:
+                            chunk = os.read(stdout_fd, self._READ_CHUNK)
+                        except BlockingIOError:
+                            break
+                        if not chunk:
+                            eof = True
+                            break
+
+                        tail += chunk
+                        if len(tail) > self._OUTPUT_TAIL_MAX:
+                            del tail[:len(tail) - self._OUTPUT_TAIL_MAX]
+
+                        pending += chunk
+                        if b'\n' in pending or b'\r' in pending:
+                            # tqdm redraws with bare \r, so both count as
+                            # line breaks here
+                            parts = pending.replace(b'\r', b'\n').split(b'\n')
+                            pending = bytearray(parts.pop())
+                            for part in parts:
+                                if part:
+                                    handle_line(part)
+
+                if pending:
+                    handle_line(bytes(pending))
+
+                # Wait for process to complete
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.1, deadline - time.monotonic())
+                process.wait(timeout=remaining)
+
+            except subprocess.TimeoutExpired:
+                process.kill()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            finally:
+                selector.close()
+                process.stdout.close()
+
+            # Final progress update
+            if progress_data['total'] > 0:
+                progress_data['current'] = progress_data['total']
+                progress_data['stage'] = 'Complete!'
+                update_progress()
+
+            print()  # New line after progress bar
+
+            # Create a result object similar to subprocess.run
+            class ProcessResult:
+                def __init__(self, returncode, stdout):
+                    self.returncode = returncode
+                    self.stdout = stdout
+                    self.stderr = ''
+
+            # Decode once, and only the bounded tail - enough for the
+            # callers' offset extraction
+            return ProcessResult(process.returncode,
+                                 tail.decode('utf-8', errors='replace'))
+
+        except subprocess.TimeoutExpired:
+            raise
+        except Exception as e:
+            print(f"\n   \u274c Error during progress tracking: {e}")
+            # Fallback to regular subprocess.run
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+    def _record_sync_result(self, video_path, subtitle_path, output_path, language, success, processing_time, method):
+        """Record sync result in database (legacy signature).
+
+        Delegates to record_sync_result so these rows ride the same
+        batched buffer instead of paying a commit each - and land in
+        the columns the schema actually has. The language column never
+        existed in sync_history; it is carried in the method tag.
+        """
+        if not hasattr(self, 'conn') or not self.conn:
+            return
+
+        self.record_sync_result(video_path, subtitle_path, output_path, success,
+                                0.0, processing_time, f"{method}_{language}")
\ No newline at end of file
@@ -1,104 +1,126 @@
-#!/usr/bin/env python3
-"""
-Path Mapping Utilities
-Helper functions for managing environment-specific path mappings
-"""
-
-from config import config
-import os
-
-def get_current_environment_paths():
-    """Get the current environment path configuration"""
-    current_env = config.get("current_environment", "mac_local")
-    env_paths = config.get("environment_paths", {})
-    
-    if current_env in env_paths:
-        return env_paths[current_env]
-    
-    # Fallback to legacy configuration
-    return {
-        "movies_local": "/Volumes/Data/Movies",
-        "movies_plex": "/PlexMedia/Movies",
-        "cartoons_local": "/Volumes/Data/Cartoons",
-        "cartoons_plex": "/PlexMedia/Cartoons",
-        "documentaries_local": "/Volumes/Data/Documentaries",
-        "documentaries_plex": "/PlexMedia/Documentaries",
-        "christmas_local": "/Volumes/Data/Christmas",
-        "christmas_plex": "/PlexMedia/Christmas",
-        "series_local": "/Volumes/Data/TVShows", 
-        "series_plex": "/PlexMedia/TVShows",
-        "description": "Fallback configuration with multiple movie libraries"
-    }
-
-def convert_local_path_to_plex_path(local_path):
-    """Convert a local path to the corresponding Plex path"""
-    env_paths = get_current_environment_paths()
-    
-    # Try to match against configured paths
-    if local_path.startswith(env_paths.get("movies_local", "")):
-        relative_path = local_path.replace(env_paths["movies_local"], "")
-        return env_paths.get("movies_plex", "") + relative_path
-    
-    if local_path.startswith(env_paths.get("series_local", "")):
-        relative_path = local_path.replace(env_paths["series_local"], "")
-        return env_paths.get("series_plex", "") + relative_path
-    
-    # Fallback to legacy path mappings
-    path_mappings = config.get("path_mappings", {})
-    for plex_path, mapped_local_path in path_mappings.items():
-        if local_path.startswith(mapped_local_path):
-            relative_path = local_path.replace(mapped_local_path, "")
-            return plex_path + relative_path
-    
-    # Return original path if no mapping found
-    return local_path
-
-def convert_plex_path_to_local_path(plex_path):
-    """Convert a Plex path to the corresponding local path"""
-    env_paths = get_current_environment_paths()
-    
-    # Try to match against configured paths
-    if plex_path.startswith(env_paths.get("movies_plex", "")):
-        relative_path = plex_path.replace(env_paths["movies_plex"], "")
-        return env_paths.get("movies_local", "") + relative_path
-    
-    if plex_path.startswith(env_paths.get("series_plex", "")):
-        relative_path = plex_path.replace(env_paths["series_plex"], "")
-        return env_paths.get("series_local", "") + relative_path
-    
-    # Fallback to legacy path mappings
-    path_mappings = config.get("path_mappings", {})
-    for mapped_plex_path, local_path in path_mappings.items():
-        if plex_path.startswith(mapped_plex_path):
-            relative_path = plex_path.replace(mapped_plex_path, "")
-            return local_path + relative_path
-    
-    # Return original path if no mapping found
-    return plex_path
-
-def validate_environment_paths():
-    """Validate that current environment paths are accessible"""
-    env_paths = get_current_environment_paths()
-    
-    results = {}
-    
-    for path_type in ["movies_local", "series_local"]:
-        path = env_paths.get(path_type)
-        if path:
-            results[path_type] = os.path.exists(path)
-        else:
-            results[path_type] = None
-    
-    return results
-
-def get_environment_summary():
-    """Get a summary of current environment configuration"""
-    current_env = config.get("current_environment", "mac_local")
-    env_paths = get_current_environment_paths()
-    
-    return {
-        "environment": current_env,
-        "description": env_paths.get("description", "No description"),
-        "paths": env_paths,
-        "validation": validate_environment_paths()
-    }
+#!/usr/bin/env python3
+"""
+Path Mapping Utilities
+Helper functions for managing environment-specific path mappings
+"""
+
+from config import config
+import os
+import re
+
+def get_current_environment_paths():
+    """Get the current environment path configuration"""
+    current_env = config.get("current_environment", "mac_local")
+    env_paths = config.get("environment_paths", {})
+    
+    if current_env in env_paths:
+        return env_paths[current_env]
+    
+    # Fallback to legacy configuration
+    return {
+        "movies_local": "/Volumes/Data/Movies",
+        "movies_plex": "/PlexMedia/Movies",
+        "cartoons_local": "/Volumes/Data/Cartoons",
+        "cartoons_plex": "/PlexMedia/Cartoons",
+        "documentaries_local": "/Volumes/Data/Documentaries",
+        "documentaries_plex": "/PlexMedia/Documentaries",
+        "christmas_local": "/Volumes/Data/Christmas",
+        "christmas_plex": "/PlexMedia/Christmas",
+        "series_local": "/Volumes/Data/TVShows", 
+        "series_plex": "/PlexMedia/TVShows",
+        "description": "Fallback configuration with multiple movie libraries"
+    }
+
+# Compiled prefix tables for the converters. Each is (source_pairs,
+# compiled_pattern, prefix -> replacement dict), rebuilt only when the
+# configured mappings change; the regex alternation tries prefixes in
+# the same priority order as the old if/elif chain but matches them all
+# in one anchored C-level pass.
+_L2P_TABLE = None
+_P2L_TABLE = None
+
+def _compile_table(pairs):
+    """Build (compiled anchored pattern, mapping) from (prefix, replacement) pairs"""
+    mapping = {src: dst for src, dst in pairs if src}
+    if not mapping:
+        return None, mapping
+    pattern = re.compile("^(?:" + "|".join(re.escape(src) for src in mapping) + ")")
+    return pattern, mapping
+
+def _conversion_pairs(direction):
+    """Collect (prefix, replacement) pairs for one direction, priority order"""
+    env_paths = get_current_environment_paths()
+    path_mappings = config.get("path_mappings", {})
+
+    if direction == "local_to_plex":
+        pairs = [(env_paths.get("movies_local"), env_paths.get("movies_plex", "")),
+                 (env_paths.get("series_local"), env_paths.get("series_plex", ""))]
+        pairs += [(local, plex) for plex, local in path_mappings.items()]
+    else:
+        pairs = [(env_paths.get("movies_plex"), env_paths.get("movies_local", "")),
+                 (env_paths.get("series_plex"), env_paths.get("series_local", ""))]
+        pairs += list(path_mappings.items())
+
+    return tuple(pairs)
+
+def _get_table(direction):
+    """Return (pattern, mapping) for direction, rebuilding on config change"""
+    global _L2P_TABLE, _P2L_TABLE
+    pairs = _conversion_pairs(direction)
+    cached = _L2P_TABLE if direction == "local_to_plex" else _P2L_TABLE
+    if cached is None or cached[0] != pairs:
+        cached = (pairs,) + _compile_table(pairs)
+        if direction == "local_to_plex":
+            _L2P_TABLE = cached
+        else:
+            _P2L_TABLE = cached
+    return cached[1], cached[2]
+
+def _convert(path, direction):
+    """Rewrite the first matching prefix of path, or return it unchanged"""
+    pattern, mapping = _get_table(direction)
+    if pattern is not None:
+        converted, matched = pattern.subn(lambda m: mapping[m.group(0)], path, count=1)
+        if matched:
+            return converted
+    return path
+
+def convert_local_path_to_plex_path(local_path):
+    """Convert a local path to the corresponding Plex path"""
+    return _convert(local_path, "local_to_plex")
+
+def convert_plex_path_to_local_path(plex_path):
+    """Convert a Plex path to the corresponding local path"""
+    return _convert(plex_path, "plex_to_local")
+
+def validate_environment_paths():
+    """Validate that current environment paths are accessible"""
+    env_paths = get_current_environment_paths()
+    
+    results = {}
+    
+    for path_type in ["movies_local", "series_local"]:
+        path = env_paths.get(path_type)
+        if path:
+            results[path_type] = os.path.exists(path)
+        else:
+            results[path_type] = None
+    
+    return results
+
+def get_environment_summary():
+    """Get a summary of current environment configuration"""
+    current_env = config.get("current_environment", "mac_local")
+    env_paths = get_current_environment_paths()
+    validation = validate_environment_paths()
+
+    # The *_items tuples are the same data flattened for display loops:
+    # already filtered, so callers just walk pairs without dict lookups
+    return {
+        "environment": current_env,
+        "description": env_paths.get("description", "No description"),
+        "paths": env_paths,
+        "paths_items": tuple((k, v) for k, v in env_paths.items() if k != "description"),
+        "validation": validation,
+        "validation_items": tuple(validation.items())
+    }